@@ -45,8 +45,10 @@ if "bpy" in locals():
 import bpy
 from bpy.props import (
         StringProperty,
+        CollectionProperty,
         BoolProperty,
         FloatProperty,
+        IntProperty,
         EnumProperty,
         )
 from bpy_extras.io_utils import (
@@ -68,6 +70,10 @@ class ImportFBX(bpy.types.Operator, ImportHelper, IOFBXOrientationHelper):
     bl_options = {'UNDO', 'PRESET'}
 
     directory = StringProperty()
+    files = CollectionProperty(
+            type=bpy.types.OperatorFileListElement,
+            options={'HIDDEN', 'SKIP_SAVE'},
+            )
 
     filename_ext = ".fbx"
     filter_glob = StringProperty(default="*.fbx", options={'HIDDEN'})
@@ -189,6 +195,14 @@ class ImportFBX(bpy.types.Operator, ImportHelper, IOFBXOrientationHelper):
             default=True,
             )
 
+    import_jobs = IntProperty(
+            name="Import Jobs",
+            description="Number of background Blender processes reading files in parallel, "
+                        "when importing several files at once",
+            min=1, soft_max=64,
+            default=1,
+            )
+
     def draw(self, context):
         layout = self.layout
 
@@ -217,6 +231,8 @@ class ImportFBX(bpy.types.Operator, ImportHelper, IOFBXOrientationHelper):
             layout.prop(self, "decal_offset")
 
             layout.prop(self, "use_prepost_rot")
+
+            layout.prop(self, "import_jobs")
         elif self.ui_tab == 'ARMATURE':
             layout.prop(self, "ignore_leaf_bones")
             layout.prop(self, "force_connect_children"),
@@ -227,10 +243,16 @@ class ImportFBX(bpy.types.Operator, ImportHelper, IOFBXOrientationHelper):
             sub.prop(self, "secondary_bone_axis")
 
     def execute(self, context):
-        keywords = self.as_keywords(ignore=("filter_glob", "directory", "ui_tab"))
+        import os
+
+        keywords = self.as_keywords(ignore=("filter_glob", "directory", "ui_tab", "files", "import_jobs"))
         keywords["use_cycles"] = (context.scene.render.engine == 'CYCLES')
 
         from . import import_fbx
+        filepaths = [os.path.join(self.directory, f.name) for f in self.files if f.name]
+        if len(filepaths) > 1:
+            del keywords["filepath"]
+            return import_fbx.load_multi(self, context, filepaths=filepaths, import_jobs=self.import_jobs, **keywords)
         return import_fbx.load(self, context, **keywords)
 
 
@@ -402,6 +424,14 @@ class ExportFBX(bpy.types.Operator, ExportHelper, IOFBXOrientationHelper):
             description="Only write deforming bones (and non-deforming ones when they have deforming children)",
             default=False,
             )
+    # 7.4 only
+    max_bone_influences = IntProperty(
+            name="Max Bone Influences",
+            description="Maximum number of bones deforming each vertex of skinned meshes, lowest weights are "
+                        "dropped and remaining ones scaled to keep the same total (0 for no limit)",
+            min=0, soft_max=8,
+            default=0,
+            )
     armature_nodetype = EnumProperty(
             name="Armature FBXNode Type",
             items=(('NULL', "Null", "'Null' FBX node, similar to Blender's Empty (default)"),
@@ -494,6 +524,36 @@ class ExportFBX(bpy.types.Operator, ExportHelper, IOFBXOrientationHelper):
             description="Embed textures in FBX binary file (only for \"Copy\" path mode!)",
             default=False,
             )
+    # 7.4 only
+    compression_level = IntProperty(
+            name="Compression",
+            description="Compression level of array data in FBX binary file "
+                        "(0 to disable compression, for fastest export but biggest files; "
+                        "9 for smallest files but slowest export)",
+            min=0, max=9,
+            default=1,
+            )
+    # 7.4 only
+    geometry_cache_dir = StringProperty(
+            name="Geometry Cache",
+            description="Directory where to cache encoded mesh geometries, to reuse them in later exports "
+                        "of unchanged meshes (leave empty to disable)",
+            subtype='DIR_PATH',
+            )
+    geometry_cache_size = IntProperty(
+            name="Cache Size",
+            description="Maximum size of the geometry cache, in megabytes (least recently used geometries "
+                        "are removed first)",
+            min=1, soft_max=16384,
+            default=1024,
+            )
+    # 7.4 only
+    use_incremental = BoolProperty(
+            name="Incremental",
+            description="Reuse geometries of unchanged meshes from the previous export to the same file "
+                        "(tracked in a '.fbxmanifest' file next to it)",
+            default=False,
+            )
     batch_mode = EnumProperty(
             name="Batch Mode",
             items=(('OFF', "Off", "Active scene to file"),
@@ -506,6 +566,14 @@ class ExportFBX(bpy.types.Operator, ExportHelper, IOFBXOrientationHelper):
             description="Create a dir for each exported file",
             default=True,
             )
+    # 7.4 only
+    batch_jobs = IntProperty(
+            name="Batch Jobs",
+            description="Number of background Blender processes exporting in parallel in batch mode "
+                        "(the .blend file must be saved to use more than one)",
+            min=1, soft_max=64,
+            default=1,
+            )
     use_metadata = BoolProperty(
             name="Use Metadata",
             default=True,
@@ -544,10 +612,14 @@ class ExportFBX(bpy.types.Operator, ExportHelper, IOFBXOrientationHelper):
                 sub = row.row(align=True)
                 sub.enabled = (self.path_mode == 'COPY')
                 sub.prop(self, "embed_textures", text="", icon='PACKAGE' if self.embed_textures else 'UGLYPACKAGE')
+                layout.prop(self, "compression_level")
                 row = layout.row(align=True)
                 row.prop(self, "batch_mode")
                 sub = row.row(align=True)
                 sub.prop(self, "use_batch_own_dir", text="", icon='NEWFOLDER')
+                sub = layout.row()
+                sub.enabled = (self.batch_mode != 'OFF')
+                sub.prop(self, "batch_jobs")
             elif self.ui_tab == 'GEOMETRY':
                 layout.prop(self, "use_mesh_modifiers")
                 sub = layout.row()
@@ -558,9 +630,16 @@ class ExportFBX(bpy.types.Operator, ExportHelper, IOFBXOrientationHelper):
                 sub = layout.row()
                 #~ sub.enabled = self.mesh_smooth_type in {'OFF'}
                 sub.prop(self, "use_tspace")
+                layout.separator()
+                layout.prop(self, "geometry_cache_dir")
+                sub = layout.row()
+                sub.enabled = bool(self.geometry_cache_dir)
+                sub.prop(self, "geometry_cache_size")
+                layout.prop(self, "use_incremental")
             elif self.ui_tab == 'ARMATURE':
                 layout.prop(self, "use_armature_deform_only")
                 layout.prop(self, "add_leaf_bones")
+                layout.prop(self, "max_bone_influences")
                 layout.prop(self, "primary_bone_axis")
                 layout.prop(self, "secondary_bone_axis")
                 layout.prop(self, "armature_nodetype")
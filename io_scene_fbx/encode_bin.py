@@ -25,8 +25,10 @@ try:
 except:
     import data_types
 
-from struct import pack
+from collections import deque
+from struct import pack, unpack_from, error as StructError
 import array
+import os
 import zlib
 
 _BLOCK_SENTINEL_LENGTH = 13
@@ -46,6 +48,111 @@ _FOOT_ID = b'\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e'
 _ELEMS_ID_ALWAYS_BLOCK_SENTINEL = {b"AnimationStack", b"AnimationLayer"}
 
 
+class FBXCompressionPolicy:
+    """
+    How array properties get compressed.
+
+    level is the zlib compression level (0 disables compression), arrays of threshold bytes or less are never
+    compressed, and overrides maps element ids to a specific level for their arrays (e.g. {b'KeyTime': 0}).
+    Defaults mimic behavior of fbxconverter.
+    """
+
+    __slots__ = (
+        "level",
+        "threshold",
+        "overrides",
+        )
+
+    def __init__(self, level=1, threshold=128, overrides=None):
+        assert(0 <= level <= 9)
+        self.level = level
+        self.threshold = threshold
+        self.overrides = {} if overrides is None else overrides
+
+    def get_level(self, elem_id, data_len):
+        """
+        Return compression level to use for an array of data_len bytes in given element, 0 for no compression.
+        """
+        if data_len <= self.threshold:
+            return 0
+        return self.overrides.get(elem_id, self.level)
+
+
+_compression_policy = FBXCompressionPolicy()
+
+
+def set_compression_policy(policy=None):
+    """
+    Set compression policy used by all FBXElem array properties added from now on (None for the default one).
+    Returns previous policy.
+    """
+    global _compression_policy
+    prev_policy = _compression_policy
+    _compression_policy = FBXCompressionPolicy() if policy is None else policy
+    return prev_policy
+
+
+def get_compression_policy():
+    return _compression_policy
+
+
+# Arrays bigger than this (in bytes) are compressed in worker threads (zlib releases the GIL),
+# smaller ones are not worth the overhead.
+_COMPRESS_ASYNC_MIN_SIZE = 1 << 16
+_compress_executor = None
+# Limit the amount of queued jobs, since each of them keeps its uncompressed data alive.
+_compress_pending = None
+_compress_pending_max = 0
+
+
+def set_compression_executor(executor=None, max_pending=None):
+    """
+    Set the executor (e.g. a concurrent.futures.ThreadPoolExecutor) compressing big arrays of FBXElem properties
+    added from now on in the background, with at most max_pending queued jobs (twice the CPU count by default).
+    None compresses everything synchronously. The executor is owned (and shut down) by the caller.
+    Returns previous executor.
+    """
+    global _compress_executor, _compress_pending, _compress_pending_max
+    prev_executor = _compress_executor
+    _compress_executor = executor
+    _compress_pending = deque()
+    _compress_pending_max = max_pending if max_pending is not None else (os.cpu_count() or 1) * 2
+    return prev_executor
+
+
+def _compress_array_async(data, length, level):
+    """
+    Return a future of the packed (compressed) array property for given raw data.
+    """
+    while _compress_pending and _compress_pending[0].done():
+        _compress_pending.popleft()
+    if len(_compress_pending) >= _compress_pending_max:
+        _compress_pending.popleft().result()
+    future = _compress_executor.submit(_compress_array, data, length, level)
+    _compress_pending.append(future)
+    return future
+
+
+def _compress_array(data, length, level):
+    data = zlib.compress(data, level)
+    return (pack('<3I', length, 1, len(data)), data)
+
+
+def _prop_len(data):
+    # Array properties are stored as a (header, payload) tuple, to avoid copying the payload.
+    if type(data) is tuple:
+        return len(data[0]) + len(data[1])
+    return len(data)
+
+
+def _prop_write(write, data):
+    if type(data) is tuple:
+        for chunk in data:
+            write(chunk)
+    else:
+        write(data)
+
+
 class FBXElem:
     __slots__ = (
         "id",
@@ -131,64 +238,70 @@ class FBXElem:
         self.props.append(data)
 
     def _add_array_helper(self, data, array_type, prop_type):
-        assert(isinstance(data, array.array))
-        assert(data.typecode == array_type)
+        """
+        data may be any buffer of matching item type (array, NumPy array, memoryview...), or an iterable of values.
+        Buffers are not copied unless needed, so they must not be modified afterwards.
+        """
+        try:
+            data = memoryview(data)
+        except TypeError:
+            data = memoryview(array.array(array_type, data))
+        assert(data.itemsize == array.array(array_type).itemsize)
+        assert((data.format[-1] in 'fd') == (array_type in 'fd'))
 
-        length = len(data)
+        length = data.nbytes // data.itemsize
 
         if _IS_BIG_ENDIAN:
-            data = data[:]
-            data.byteswap()
-        data = data.tobytes()
-
-        # mimic behavior of fbxconverter (also common sense)
-        # we could make this configurable.
-        encoding = 0 if len(data) <= 128 else 1
-        if encoding == 0:
-            pass
-        elif encoding == 1:
-            data = zlib.compress(data, 1)
-
-        comp_len = len(data)
-
-        data = pack('<3I', length, encoding, comp_len) + data
+            data_swapped = array.array(array_type)
+            data_swapped.frombytes(data.tobytes())
+            data_swapped.byteswap()
+            data = memoryview(data_swapped)
+        if not data.c_contiguous:
+            data = memoryview(data.tobytes())
+        data = data.cast('B')
+
+        level = _compression_policy.get_level(self.id, len(data))
+        if level == 0:
+            data = (pack('<3I', length, 0, len(data)), data)
+        elif _compress_executor is None or len(data) < _COMPRESS_ASYNC_MIN_SIZE:
+            data = _compress_array(data, length, level)
+        else:
+            # Compressed in the background, see _resolve_props().
+            data = _compress_array_async(data, length, level)
 
         self.props_type.append(prop_type)
         self.props.append(data)
 
     def add_int32_array(self, data):
-        if not isinstance(data, array.array):
-            data = array.array(data_types.ARRAY_INT32, data)
         self._add_array_helper(data, data_types.ARRAY_INT32, data_types.INT32_ARRAY)
 
     def add_int64_array(self, data):
-        if not isinstance(data, array.array):
-            data = array.array(data_types.ARRAY_INT64, data)
         self._add_array_helper(data, data_types.ARRAY_INT64, data_types.INT64_ARRAY)
 
     def add_float32_array(self, data):
-        if not isinstance(data, array.array):
-            data = array.array(data_types.ARRAY_FLOAT32, data)
         self._add_array_helper(data, data_types.ARRAY_FLOAT32, data_types.FLOAT32_ARRAY)
 
     def add_float64_array(self, data):
-        if not isinstance(data, array.array):
-            data = array.array(data_types.ARRAY_FLOAT64, data)
         self._add_array_helper(data, data_types.ARRAY_FLOAT64, data_types.FLOAT64_ARRAY)
 
     def add_bool_array(self, data):
-        if not isinstance(data, array.array):
-            data = array.array(data_types.ARRAY_BOOL, data)
         self._add_array_helper(data, data_types.ARRAY_BOOL, data_types.BOOL_ARRAY)
 
     def add_byte_array(self, data):
-        if not isinstance(data, array.array):
-            data = array.array(data_types.ARRAY_BYTE, data)
         self._add_array_helper(data, data_types.ARRAY_BYTE, data_types.BYTE_ARRAY)
 
     # -------------------------
     # internal helper functions
 
+    def _resolve_props(self):
+        """
+        Replace props still being compressed in the background by their final data.
+        """
+        props = self.props
+        for i, data in enumerate(props):
+            if type(data) not in {bytes, tuple}:
+                props[i] = data.result()
+
     def _calc_offsets(self, offset, is_last):
         """
         Call before writing, calculates fixed offsets.
@@ -196,13 +309,15 @@ class FBXElem:
         assert(self._end_offset == -1)
         assert(self._props_length == -1)
 
+        self._resolve_props()
+
         offset += 12  # 3 uints
         offset += 1 + len(self.id)  # len + idname
 
         props_length = 0
         for data in self.props:
             # 1 byte for the prop type
-            props_length += 1 + len(data)
+            props_length += 1 + _prop_len(data)
         self._props_length = props_length
         offset += props_length
 
@@ -234,7 +349,7 @@ class FBXElem:
 
         for i, data in enumerate(self.props):
             write(bytes((self.props_type[i],)))
-            write(data)
+            _prop_write(write, data)
 
         self._write_children(write, tell, is_last)
 
@@ -254,30 +369,431 @@ class FBXElem:
                 write(_BLOCK_SENTINEL_DATA)
 
 
-def _write_timedate_hack(elem_root):
+class FBXStreamWriter:
+    """
+    Write a binary FBX file incrementally, without having to keep the whole element tree in memory.
+
+    Elements are opened with begin_elem() and closed with end_elem(), their header being written once their
+    properties are known (at their first child or their end), and back-patched with their end offset once closed.
+    Complete sub-trees can be added as usual FBXElem children of the current element (or written directly
+    with write_elem()), flush() writes and frees all those pending children.
+
+    Output is identical to what write() would produce for the same tree.
+    """
+
+    __slots__ = (
+        "_file",
+        "_stack",  # [elem, header_offset, has_children] items of currently opened elements, root first.
+        "_pending_sentinel",  # header offset of previous sibling, if it needs a block sentinel when not last.
+        "_timedate_ok",
+        "_version",
+        "root",
+        )
+
+    # Map property types to the matching FBXElem.add_ methods, for add_prop().
+    _ADD_PROP_FUNCS = {
+        data_types.BOOL: FBXElem.add_bool,
+        data_types.INT16: FBXElem.add_int16,
+        data_types.INT32: FBXElem.add_int32,
+        data_types.INT64: FBXElem.add_int64,
+        data_types.FLOAT32: FBXElem.add_float32,
+        data_types.FLOAT64: FBXElem.add_float64,
+        data_types.BYTES: FBXElem.add_bytes,
+        data_types.STRING: FBXElem.add_string,
+        data_types.INT32_ARRAY: FBXElem.add_int32_array,
+        data_types.INT64_ARRAY: FBXElem.add_int64_array,
+        data_types.FLOAT32_ARRAY: FBXElem.add_float32_array,
+        data_types.FLOAT64_ARRAY: FBXElem.add_float64_array,
+        data_types.BOOL_ARRAY: FBXElem.add_bool_array,
+        data_types.BYTE_ARRAY: FBXElem.add_byte_array,
+    }
+
+    def __init__(self, fn, version):
+        self._file = open(fn, 'wb')
+        self._file.write(_HEAD_MAGIC)
+        self._file.write(pack('<I', version))
+        self._pending_sentinel = None
+        self._timedate_ok = 0
+        # Root element has no id, and no header either.
+        self.root = FBXElem(b"")
+        self._stack = [[self.root, self._file.tell(), False]]
+        self._version = version
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+
+    def _patch_end_offset(self, header_offset, end_offset):
+        f = self._file
+        f.seek(header_offset)
+        f.write(pack('<I', end_offset))
+        f.seek(end_offset)
+
+    def _begin_sibling(self):
+        # We now know previous sibling was not the last one, it may need a block sentinel.
+        if self._pending_sentinel is not None:
+            self._file.write(_BLOCK_SENTINEL_DATA)
+            self._patch_end_offset(self._pending_sentinel, self._file.tell())
+            self._pending_sentinel = None
+
+    def _write_header(self):
+        # Write header of current element, if not yet done.
+        item = self._stack[-1]
+        elem, header_offset, _has_children = item
+        if header_offset is not None:
+            return
+        self._begin_sibling()
+        if len(self._stack) == 2:
+            self._timedate_ok += _write_timedate_hack_elem(elem)
+        elem._resolve_props()
+        write = self._file.write
+        item[1] = self._file.tell()
+
+        props_length = sum(1 + _prop_len(data) for data in elem.props)
+        # end offset is written once the element is closed.
+        write(pack('<3I', 0, len(elem.props), props_length))
+        write(bytes((len(elem.id),)))
+        write(elem.id)
+        for i, data in enumerate(elem.props):
+            write(bytes((elem.props_type[i],)))
+            _prop_write(write, data)
+
+    def write_elem(self, elem):
+        """
+        Write a complete FBXElem sub-tree as next child of the current element.
+        """
+        assert(elem.id != b'')
+        f = self._file
+        self._write_header()
+        self._stack[-1][2] = True
+        self._begin_sibling()
+
+        if len(self._stack) == 1:
+            # hack since we don't decode time.
+            # ideally we would _not_ modify this data.
+            self._timedate_ok += _write_timedate_hack_elem(elem)
+
+        # Whether this element gets a block sentinel depends on it being the last child of its parent,
+        # which we do not know yet, assume it is and fix it later if needed.
+        header_offset = f.tell()
+        elem._calc_offsets(header_offset, True)
+        elem._write(f.write, f.tell, True)
+        if not elem.elems and (not elem.props or elem.id in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL):
+            self._pending_sentinel = header_offset
+
+    def flush(self):
+        """
+        Write and free all complete children added to the current element so far.
+        """
+        elem = self._stack[-1][0]
+        self._write_header()
+        for sub_elem in elem.elems:
+            self.write_elem(sub_elem)
+        elem.elems.clear()
+
+    def begin_elem(self, id):
+        """
+        Open a new element as next child of the current one, and return it (as a FBXElem).
+
+        Its properties may be added (with add_prop() or its own add_ methods) until its first child.
+        """
+        self.flush()
+        self._stack[-1][2] = True
+        elem = FBXElem(id)
+        self._stack.append([elem, None, False])
+        return elem
+
+    def add_prop(self, prop_type, data):
+        """
+        Add a property of given type (one of data_types ones) to the current element.
+        """
+        item = self._stack[-1]
+        assert(item[1] is None)  # Header already written!
+        self._ADD_PROP_FUNCS[prop_type](item[0], data)
+
+    def end_elem(self):
+        """
+        Close current element, back-patching its header.
+        """
+        self.flush()
+        elem, header_offset, has_children = self._stack.pop()
+        f = self._file
+
+        if has_children:
+            # Last child never gets a block sentinel, but its parent always does.
+            self._pending_sentinel = None
+            f.write(_BLOCK_SENTINEL_DATA)
+            self._patch_end_offset(header_offset, f.tell())
+        else:
+            self._patch_end_offset(header_offset, f.tell())
+            if not elem.props or elem.id in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL:
+                self._pending_sentinel = header_offset
+
+    def close(self):
+        """
+        Write remaining top-level elements and the footer, and close the file.
+        """
+        assert(len(self._stack) == 1)
+        self.flush()
+        f = self._file
+
+        self._pending_sentinel = None
+        f.write(_BLOCK_SENTINEL_DATA)
+
+        if self._timedate_ok != 2:
+            print("Missing fields!")
+
+        _write_footer(f.write, f.tell, self._version)
+        f.close()
+
+
+# -------------------------------------
+# Persistent cache of encoded sub-trees
+
+def _elem_dump(write, elem):
+    # Props are stored already encoded (and compressed), offsets are only computed when writing the FBX file.
+    elem._resolve_props()
+    write(bytes((len(elem.id),)))
+    write(elem.id)
+    write(pack('<I', len(elem.props)))
+    write(bytes(elem.props_type))
+    for data in elem.props:
+        write(pack('<I', _prop_len(data)))
+        _prop_write(write, data)
+    write(pack('<I', len(elem.elems)))
+    for sub_elem in elem.elems:
+        _elem_dump(write, sub_elem)
+
+
+def _elem_load(data, offset):
+    elem = FBXElem(bytes(data[offset + 1:offset + 1 + data[offset]]))
+    offset += 1 + data[offset]
+    props_nbr, = unpack_from('<I', data, offset)
+    offset += 4
+    elem.props_type[:] = data[offset:offset + props_nbr]
+    offset += props_nbr
+    props = elem.props
+    for _ in range(props_nbr):
+        prop_len, = unpack_from('<I', data, offset)
+        offset += 4
+        props.append(bytes(data[offset:offset + prop_len]))
+        offset += prop_len
+    elems_nbr, = unpack_from('<I', data, offset)
+    offset += 4
+    for _ in range(elems_nbr):
+        sub_elem, offset = _elem_load(data, offset)
+        elem.elems.append(sub_elem)
+    return elem, offset
+
+
+# Size of fixed-size props, by prop type.
+_PROP_SIZES = {
+    data_types.BOOL: 1,
+    data_types.INT16: 2,
+    data_types.INT32: 4,
+    data_types.INT64: 8,
+    data_types.FLOAT32: 4,
+    data_types.FLOAT64: 8,
+}
+_PROPS_ARRAY = {
+    data_types.INT32_ARRAY, data_types.INT64_ARRAY, data_types.FLOAT32_ARRAY, data_types.FLOAT64_ARRAY,
+    data_types.BOOL_ARRAY, data_types.BYTE_ARRAY,
+}
+
+
+def _elem_load_fbx(data, offset, file_offset):
+    end_offset, prop_count, _prop_length = unpack_from('<3I', data, offset)
+    if end_offset == 0:
+        return None, offset + _BLOCK_SENTINEL_LENGTH  # Block sentinel.
+    end_offset -= file_offset
+
+    id_len = data[offset + 12]
+    offset += 13
+    elem = FBXElem(bytes(data[offset:offset + id_len]))
+    offset += id_len
+
+    props = elem.props
+    props_type = elem.props_type
+    for _ in range(prop_count):
+        prop_type = data[offset]
+        offset += 1
+        prop_size = _PROP_SIZES.get(prop_type)
+        if prop_size is None:
+            if prop_type in _PROPS_ARRAY:
+                prop_size = 12 + unpack_from('<I', data, offset + 8)[0]
+            elif prop_type in {data_types.BYTES, data_types.STRING}:
+                prop_size = 4 + unpack_from('<I', data, offset)[0]
+            else:
+                raise ValueError("Unknown property type %r" % bytes((prop_type,)))
+        props_type.append(prop_type)
+        props.append(bytes(data[offset:offset + prop_size]))
+        offset += prop_size
+
+    while offset < end_offset:
+        sub_elem, offset = _elem_load_fbx(data, offset, file_offset)
+        if sub_elem is None:
+            break
+        elem.elems.append(sub_elem)
+
+    if offset != end_offset:
+        raise ValueError("Invalid element size")
+    return elem, offset
+
+
+def elem_from_bytes(data, file_offset):
+    """
+    Build an FBXElem sub-tree from the binary data of one element, as read from given offset of an FBX file
+    written by this module (or any other 7.4 or earlier binary file). Props are kept encoded as-is.
+    This allows to copy elements from a previous FBX file into a new one, at any position.
+    """
+    elem, offset = _elem_load_fbx(memoryview(data), 0, file_offset)
+    if elem is None or offset != len(data):
+        raise ValueError("Data is not a single FBX element")
+    return elem
+
+
+class FBXElemDiskCache:
+    """
+    Persistent on-disk cache of encoded FBXElem sub-trees, to reuse them across exports.
+
+    Entries are identified by a key string (typically a hash of everything the sub-tree depends on), and stored
+    without any file offset, so that they can be written anywhere. Least recently used entries are deleted once
+    the whole cache gets bigger than max_size bytes.
+    """
+
+    __slots__ = (
+        "path",
+        "max_size",
+        "_size",
+        "hits",
+        "misses",
+        )
+
+    _MAGIC = b'FBXElemCache\x00\x01'
+    _EXT = ".fbxelem"
+
+    def __init__(self, path, max_size=1 << 30):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+        self._size = None
+        self.hits = self.misses = 0
+
+    def _entries(self):
+        ret = []
+        for fn in os.listdir(self.path):
+            if fn.endswith(self._EXT):
+                try:
+                    st = os.stat(os.path.join(self.path, fn))
+                except OSError:
+                    continue  # Deleted meanwhile, e.g. by another export process using the same cache.
+                ret.append((st.st_mtime, st.st_size, fn))
+        return ret
+
+    def get(self, key):
+        """
+        Return a new FBXElem sub-tree matching given key, or None.
+        """
+        fp = os.path.join(self.path, key + self._EXT)
+        try:
+            with open(fp, 'rb') as f:
+                data = f.read()
+            if not data.startswith(self._MAGIC):
+                raise ValueError("not a cache entry")
+            elem, offset = _elem_load(memoryview(data), len(self._MAGIC))
+            if offset != len(data):
+                raise ValueError("unexpected data size")
+            # Mark entry as recently used.
+            os.utime(fp, None)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (OSError, ValueError, IndexError, StructError) as e:
+            print("WARNING: invalid FBX cache entry %r (%s), ignoring it" % (fp, e))
+            try:
+                os.remove(fp)
+            except OSError:
+                pass
+            self.misses += 1
+            return None
+        self.hits += 1
+        return elem
+
+    def put(self, key, elem):
+        """
+        Store given FBXElem sub-tree under given key, evicting old entries if needed.
+        """
+        fp = os.path.join(self.path, key + self._EXT)
+        # Write to a temp file first, so that concurrent exports never read partial entries.
+        fp_tmp = "%s.%d.tmp" % (fp, os.getpid())
+        with open(fp_tmp, 'wb') as f:
+            f.write(self._MAGIC)
+            _elem_dump(f.write, elem)
+            size = f.tell()
+        if self._size is not None:
+            # Overwritten entry (if any) no longer counts in cache size.
+            try:
+                size -= os.stat(fp).st_size
+            except OSError:
+                pass
+        os.replace(fp_tmp, fp)
+
+        if self._size is None:
+            self._size = sum(e[1] for e in self._entries())
+        else:
+            self._size += size
+        if self._size > self.max_size:
+            self.evict()
+
+    def evict(self):
+        """
+        Delete least recently used entries until cache fits in max_size.
+        """
+        entries = sorted(self._entries())
+        size = sum(e[1] for e in entries)
+        for _mtime, entry_size, fn in entries:
+            if size <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.path, fn))
+            except OSError:
+                continue
+            size -= entry_size
+        self._size = size
+
+
+def _write_timedate_hack_elem(elem):
     # perform 2 changes
     # - set the FileID
     # - set the CreationTime
+    if elem.id == b'FileId':
+        assert(elem.props_type[0] == b'R'[0])
+        assert(len(elem.props_type) == 1)
+        elem.props.clear()
+        elem.props_type.clear()
+
+        elem.add_bytes(_FILE_ID)
+        return 1
+    elif elem.id == b'CreationTime':
+        assert(elem.props_type[0] == b'S'[0])
+        assert(len(elem.props_type) == 1)
+        elem.props.clear()
+        elem.props_type.clear()
+
+        elem.add_string(_TIME_ID)
+        return 1
+    return 0
 
+
+def _write_timedate_hack(elem_root):
     ok = 0
     for elem in elem_root.elems:
-        if elem.id == b'FileId':
-            assert(elem.props_type[0] == b'R'[0])
-            assert(len(elem.props_type) == 1)
-            elem.props.clear()
-            elem.props_type.clear()
-
-            elem.add_bytes(_FILE_ID)
-            ok += 1
-        elif elem.id == b'CreationTime':
-            assert(elem.props_type[0] == b'S'[0])
-            assert(len(elem.props_type) == 1)
-            elem.props.clear()
-            elem.props_type.clear()
-
-            elem.add_string(_TIME_ID)
-            ok += 1
-
+        ok += _write_timedate_hack_elem(elem)
         if ok == 2:
             break
 
@@ -285,6 +801,26 @@ def _write_timedate_hack(elem_root):
         print("Missing fields!")
 
 
+def _write_footer(write, tell, version):
+    write(_FOOT_ID)
+    write(b'\x00' * 4)
+
+    # padding for alignment (values between 1 & 16 observed)
+    # if already aligned to 16, add a full 16 bytes padding.
+    ofs = tell()
+    pad = ((ofs + 15) & ~15) - ofs
+    if pad == 0:
+        pad = 16
+
+    write(b'\0' * pad)
+
+    write(pack('<I', version))
+
+    # unknown magic (always the same)
+    write(b'\0' * 120)
+    write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+
+
 def write(fn, elem_root, version):
     assert(elem_root.id == b'')
 
@@ -302,20 +838,4 @@ def write(fn, elem_root, version):
         elem_root._calc_offsets_children(tell(), False)
         elem_root._write_children(write, tell, False)
 
-        write(_FOOT_ID)
-        write(b'\x00' * 4)
-
-        # padding for alignment (values between 1 & 16 observed)
-        # if already aligned to 16, add a full 16 bytes padding.
-        ofs = tell()
-        pad = ((ofs + 15) & ~15) - ofs
-        if pad == 0:
-            pad = 16
-
-        write(b'\0' * pad)
-
-        write(pack('<I', version))
-
-        # unknown magic (always the same)
-        write(b'\0' * 120)
-        write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+        _write_footer(write, tell, version)
@@ -23,12 +23,16 @@
 
 import array
 import datetime
+import hashlib
+import json
 import math
 import os
 import time
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest, chain
+from struct import error as StructError
 
 if "bpy" in locals():
     import importlib
@@ -38,12 +42,20 @@ if "bpy" in locals():
         importlib.reload(data_types)
     if "fbx_utils" in locals():
         importlib.reload(fbx_utils)
+    if "parse_fbx" in locals():
+        importlib.reload(parse_fbx)
 
 import bpy
 import bpy_extras
 from mathutils import Vector, Matrix
 
-from . import encode_bin, data_types, fbx_utils
+# NumPy is optional, we fall back to pure python code when it is not available.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from . import encode_bin, data_types, fbx_utils, parse_fbx
 from .fbx_utils import (
     # Constants.
     FBX_VERSION, FBX_HEADER_VERSION, FBX_SCENEINFO_VERSION, FBX_TEMPLATES_VERSION,
@@ -65,7 +77,7 @@ from .fbx_utils import (
     units_blender_to_fbx_factor, units_convertor, units_convertor_iter,
     matrix4_to_array, similar_values, similar_values_iter,
     # Mesh transform helpers.
-    vcos_transformed_gen, nors_transformed_gen,
+    vcos_transformed_gen, nors_transformed_gen, vcos_transformed_array, nors_transformed_array,
     # UUID from key.
     get_fbx_uuid_from_key,
     # Key generators.
@@ -811,6 +823,274 @@ def fbx_data_mesh_shapes_elements(root, me_obj, me, scene_data, fbx_me_tmpl, fbx
                                 animatable=True)
 
 
+def fbx_data_mesh_cache_key(me_obj, me, me_key, scene_data, tmpl):
+    """
+    Return a hash of everything fbx_data_mesh_elements() output depends on, as key into the geometry cache.
+    """
+    settings = scene_data.settings
+    policy = encode_bin.get_compression_policy()
+    me_fbxmats_idx = scene_data.mesh_mat_indices.get(me)
+    if me_fbxmats_idx is not None:
+        me_fbxmats_idx = (len(me_fbxmats_idx), [me_fbxmats_idx.get(m) for m in me.materials])
+    custom_props = None
+    if settings.use_custom_props:
+        custom_props = [(k, str(getattr(v, "to_list", lambda: v)())) for k, v in me.items()]
+
+    h = hashlib.sha1()
+    h.update(repr((
+        FBX_VERSION, FBX_GEOMETRY_VERSION, FBX_GEOMETRY_NORMAL_VERSION, FBX_GEOMETRY_BINORMAL_VERSION,
+        FBX_GEOMETRY_TANGENT_VERSION, FBX_GEOMETRY_SMOOTHING_VERSION, FBX_GEOMETRY_VCOLOR_VERSION,
+        FBX_GEOMETRY_UV_VERSION, FBX_GEOMETRY_MATERIAL_VERSION, FBX_GEOMETRY_LAYER_VERSION,
+        me_key, me.name, me_fbxmats_idx, custom_props, list(tmpl.items()),
+        settings.mesh_smooth_type, settings.use_mesh_edges, settings.use_tspace,
+        [tuple(r) for r in settings.global_matrix] if me_obj.use_bake_space_transform(scene_data) else None,
+        policy.level, policy.threshold, sorted(policy.overrides.items()),
+        len(me.vertices), len(me.edges), len(me.loops), len(me.polygons),
+        [uvlayer.name for uvlayer in me.uv_layers], [collayer.name for collayer in me.vertex_colors],
+        me.use_auto_smooth, me.auto_smooth_angle if me.use_auto_smooth else None,
+    )).encode())
+
+    def _hash_data(coll, attr, typecode, nbr):
+        t_data = array.array(typecode, (0,)) * (len(coll) * nbr)
+        coll.foreach_get(attr, t_data)
+        h.update(t_data)
+
+    def _hash_bools(coll, attr):
+        t_data = [False] * len(coll)
+        coll.foreach_get(attr, t_data)
+        h.update(bytes(t_data))
+
+    _hash_data(me.vertices, "co", 'f', 3)
+    _hash_data(me.edges, "vertices", 'i', 2)
+    _hash_bools(me.edges, "use_edge_sharp")
+    _hash_data(me.loops, "vertex_index", 'i', 1)
+    _hash_data(me.polygons, "loop_start", 'i', 1)
+    _hash_data(me.polygons, "loop_total", 'i', 1)
+    _hash_data(me.polygons, "material_index", 'i', 1)
+    _hash_bools(me.polygons, "use_smooth")
+    for uvlayer in me.uv_layers:
+        _hash_data(uvlayer.data, "uv", 'f', 2)
+    for collayer in me.vertex_colors:
+        _hash_data(collayer.data, "color", 'f', 3)
+    # Split normals only depend on data hashed above and auto-smooth settings, besides custom normals,
+    # which are only available through computed split normals.
+    if me.use_auto_smooth and me.has_custom_normals:
+        me.calc_normals_split()
+        _hash_data(me.loops, "normal", 'f', 3)
+        me.free_normals_split()
+
+    return h.hexdigest()
+
+
+class FBXIncrementalGeometries:
+    """
+    Reuse already encoded Geometry elements of unchanged meshes from the previous export into the same file,
+    instead of generating them again.
+
+    A manifest next to the FBX file (same path, with an extra '.fbxmanifest' extension) maps the content hash of
+    each exported mesh (see fbx_data_mesh_cache_key()) to the UUID of its Geometry element, whose byte range is
+    found through the parse_fbx offset index of the file. Meshes not found there are looked up in (and stored
+    into) the optional fallback cache (e.g. an encode_bin.FBXElemDiskCache).
+
+    Same get()/put() interface as encode_bin.FBXElemDiskCache, so that it can be used as geometry cache.
+    Since the previous file is read while exporting, the new one has to be written to another (temp) path,
+    and only moved in place once close() has been called.
+    """
+
+    __slots__ = (
+        "filepath",
+        "fallback",
+        "hits",
+        "misses",
+        "_file",
+        "_prev_ranges",
+        "_keys",
+        )
+
+    _EXT = ".fbxmanifest"
+    _VERSION = 1
+
+    def __init__(self, filepath, fallback=None):
+        self.filepath = filepath
+        self.fallback = fallback
+        self.hits = self.misses = 0
+        self._file = None
+        self._prev_ranges = {}  # content hash -> (offset, length) of Geometry elements in previous file.
+        self._keys = {}  # content hash -> UUID of Geometry elements in new file.
+
+        try:
+            with open(self.manifest_path(filepath), 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            st = os.stat(filepath)
+            if (manifest["version"] != self._VERSION or
+                (manifest["fbx_size"], manifest["fbx_mtime_ns"]) != (st.st_size, st.st_mtime_ns)):
+                print("FBX incremental export: %r was modified since last export, exporting everything"
+                      % filepath)
+                return
+            fbx_version, entries = parse_fbx.index_get(filepath)
+            if fbx_version != FBX_VERSION:
+                return
+            uuids_ranges = {e.uuid: (e.offset, e.length) for e in entries if e.id == b"Geometry"}
+            for key, uuid in manifest["geometries"].items():
+                rng = uuids_ranges.get(uuid)
+                if rng is not None:
+                    self._prev_ranges[key] = rng
+            self._file = open(filepath, 'rb')
+        except (OSError, ValueError, KeyError, TypeError, StructError):
+            # No (valid) previous export, everything will be generated.
+            self._prev_ranges.clear()
+
+    @classmethod
+    def manifest_path(cls, filepath):
+        # Suffix the whole file name, so that e.g. 'a.fbx' and 'a.FBX' do not share the same manifest.
+        return filepath + cls._EXT
+
+    def _add_key(self, key, geom):
+        self._keys[key] = int.from_bytes(geom.props[0], 'little', signed=True)
+
+    def get(self, key):
+        rng = self._prev_ranges.get(key)
+        if rng is not None:
+            offset, length = rng
+            self._file.seek(offset)
+            try:
+                geom = encode_bin.elem_from_bytes(self._file.read(length), offset)
+            except (ValueError, StructError):
+                geom = None
+            if geom is not None and geom.id == b"Geometry":
+                self.hits += 1
+                self._add_key(key, geom)
+                return geom
+        self.misses += 1
+        geom = None if self.fallback is None else self.fallback.get(key)
+        if geom is not None:
+            self._add_key(key, geom)
+        return geom
+
+    def put(self, key, geom):
+        self._add_key(key, geom)
+        if self.fallback is not None:
+            self.fallback.put(key, geom)
+
+    def close(self):
+        """
+        Release the previous FBX file (has to be done before overwriting it).
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write_manifest(self):
+        """
+        Write the manifest (and offset index) of the newly exported FBX file.
+        """
+        filepath = self.filepath
+        try:
+            parse_fbx.index_write(filepath, *parse_fbx.index_build(filepath))
+            st = os.stat(filepath)
+            manifest = {
+                "version": self._VERSION,
+                "fbx_size": st.st_size,
+                "fbx_mtime_ns": st.st_mtime_ns,
+                "geometries": self._keys,
+            }
+            with open(self.manifest_path(filepath), 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=1, sort_keys=True)
+        except OSError as e:
+            print("WARNING: could not write FBX export manifest %r (%s)" % (self.manifest_path(filepath), e))
+
+
+def fbx_data_mesh_polygons_edges_np(me, use_mesh_edges):
+    """
+    NumPy version of the polygons & edges part of fbx_data_mesh_elements().
+    Returns the PolygonVertexIndex and Edges arrays, and the (sorted) vertex pairs of the written edges,
+    in the same order as in Edges array.
+    """
+    loop_nbr = len(me.loops)
+    t_pvi = np.empty(loop_nbr, dtype=np.int32)
+    t_ls = np.empty(len(me.polygons), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", t_pvi)
+    me.polygons.foreach_get("loop_start", t_ls)
+
+    t_ev = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", t_ev)
+    t_ev = t_ev.reshape(-1, 2)
+
+    # Add "fake" faces for loose edges.
+    if use_mesh_edges:
+        t_el = [False] * len(me.edges)
+        me.edges.foreach_get("is_loose", t_el)
+        t_le = t_ev[np.array(t_el, dtype=np.bool_)]
+        t_pvi = np.concatenate((t_pvi, t_le.reshape(-1)))
+        t_ls = np.concatenate((t_ls, np.arange(loop_nbr, loop_nbr + len(t_le), 2, dtype=np.int32)))
+        del t_el, t_le
+
+    # Edges, see fbx_data_mesh_elements() for details.
+    t_eli = np.empty(0, dtype=np.int32)
+    edges_vidx = np.empty((0, 2), dtype=np.int64)
+    nbr = len(t_pvi)
+    if nbr and len(t_ls):
+        t_ls = np.unique(t_ls)
+        li = np.arange(nbr)
+        # is_ls[li + 1] is True for the last loop of a poly.
+        is_ls = np.zeros(nbr + 1, dtype=np.bool_)
+        is_ls[t_ls] = True
+        is_start = is_ls[:nbr].copy()
+        is_start[0] = True
+        vi = t_pvi.astype(np.int64)
+        vi_start = vi[np.maximum.accumulate(np.where(is_start, li, 0))]
+        vi2 = np.where(is_ls[1:], vi_start, np.roll(vi, -1))
+
+        # Edge keys as single integers, (v1, v2) -> v1 * v_nbr + v2.
+        v_nbr = max(int(vi.max()), int(t_ev.max()) if len(t_ev) else 0) + 1
+        e_keys = np.minimum(vi, vi2) * v_nbr + np.maximum(vi, vi2)
+        todo_edges = np.sort(t_ev, axis=1).astype(np.int64)
+        todo_edges = np.unique(todo_edges[:, 0] * v_nbr + todo_edges[:, 1])
+        if len(todo_edges):
+            e_mask = todo_edges[np.minimum(np.searchsorted(todo_edges, e_keys), len(todo_edges) - 1)] == e_keys
+        else:
+            e_mask = np.zeros(nbr, dtype=np.bool_)
+        li = li[e_mask]
+        e_keys = e_keys[e_mask]
+
+        # Each edge is represented by the first loop using it.
+        _, e_first = np.unique(e_keys, return_index=True)
+        e_first.sort()
+        t_eli = li[e_first].astype(np.int32)
+        e_keys = e_keys[e_first]
+        edges_vidx = np.column_stack((e_keys // v_nbr, e_keys % v_nbr))
+        del li, is_ls, is_start, vi, vi_start, vi2, e_keys, todo_edges, e_mask, e_first
+
+        # We have to ^-1 last index of each loop.
+        t_pvi[t_ls - 1] ^= -1
+
+    return t_pvi, t_eli, edges_vidx
+
+
+def fbx_data_mesh_loops_indexed_np(t_data, width):
+    """
+    NumPy version of the 'tuple(set(values))' deduplication and per-loop index mapping of IndexToDirect layers.
+    Gives exactly the same unique values (in the same order) and indices as the pure python code, since the order
+    of a python set only depends on the sequence of distinct values added to it.
+    Returns the flat unique values and the per-loop indices.
+    """
+    t_data = np.ascontiguousarray(t_data, dtype=np.float64).reshape(-1, width)
+    # Adding 0.0 turns -0.0 into 0.0, which are the same value for python sets too.
+    t_void = np.ascontiguousarray(t_data + 0.0).view(np.dtype((np.void, t_data.itemsize * width))).reshape(-1)
+    _, first, inv = np.unique(t_void, return_index=True, return_inverse=True)
+    del t_void
+
+    # Distinct values, in the order they would get added to the set.
+    order = np.argsort(first)
+    uniq = tuple(map(tuple, t_data[first[order]].tolist()))
+    set_uniq = tuple(set(uniq))
+    set_idx = {v: idx for idx, v in enumerate(set_uniq)}
+    uniq_idx = np.empty(len(uniq), dtype=np.int32)
+    uniq_idx[order] = [set_idx[v] for v in uniq]
+
+    return np.array(set_uniq, dtype=np.float64).reshape(-1), uniq_idx[inv.reshape(-1)]
+
+
 def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     """
     Write the Mesh (Geometry) data block.
@@ -826,6 +1106,19 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     if me_key in done_meshes:
         return
 
+    # Try to reuse already encoded geometry from a previous export (meshes with shape keys are not cached,
+    # as those also write other elements).
+    geom_cache = scene_data.settings.geometry_cache
+    geom_cache_key = None
+    if geom_cache is not None and me not in scene_data.data_deformers_shape:
+        tmpl = elem_props_template_init(scene_data.templates, b"Geometry")
+        geom_cache_key = fbx_data_mesh_cache_key(me_obj, me, me_key, scene_data, tmpl)
+        geom = geom_cache.get(geom_cache_key)
+        if geom is not None:
+            root.elems.append(geom)
+            done_meshes.add(me_key)
+            return
+
     # No gscale/gmat here, all data are supposed to be in object space.
     smooth_type = scene_data.settings.mesh_smooth_type
     write_normals = True  # smooth_type in {'OFF'}
@@ -856,9 +1149,14 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     elem_data_single_int32(geom, b"GeometryVersion", FBX_GEOMETRY_VERSION)
 
     # Vertex cos.
-    t_co = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.vertices) * 3
-    me.vertices.foreach_get("co", t_co)
-    elem_data_single_float64_array(geom, b"Vertices", chain(*vcos_transformed_gen(t_co, geom_mat_co)))
+    if np is not None:
+        t_co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+        me.vertices.foreach_get("co", t_co)
+        elem_data_single_float64_array(geom, b"Vertices", vcos_transformed_array(t_co, geom_mat_co))
+    else:
+        t_co = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.vertices) * 3
+        me.vertices.foreach_get("co", t_co)
+        elem_data_single_float64_array(geom, b"Vertices", chain(*vcos_transformed_gen(t_co, geom_mat_co)))
     del t_co
 
     # Polygon indices.
@@ -866,21 +1164,7 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     # We do loose edges as two-vertices faces, if enabled...
     #
     # Note we have to process Edges in the same time, as they are based on poly's loops...
-    loop_nbr = len(me.loops)
-    t_pvi = array.array(data_types.ARRAY_INT32, (0,)) * loop_nbr
-    t_ls = [None] * len(me.polygons)
-
-    me.loops.foreach_get("vertex_index", t_pvi)
-    me.polygons.foreach_get("loop_start", t_ls)
-
-    # Add "fake" faces for loose edges.
-    if scene_data.settings.use_mesh_edges:
-        t_le = tuple(e.vertices for e in me.edges if e.is_loose)
-        t_pvi.extend(chain(*t_le))
-        t_ls.extend(range(loop_nbr, loop_nbr + len(t_le), 2))
-        del t_le
-
-    # Edges...
+    #
     # Note: Edges are represented as a loop here: each edge uses a single index, which refers to the polygon array.
     #       The edge is made by the vertex indexed py this polygon's point and the next one on the same polygon.
     #       Advantage: Only one index per edge.
@@ -888,46 +1172,73 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     #                 for loose edges).
     #       We also have to store a mapping from real edges to their indices in this array, for edge-mapped data
     #       (like e.g. crease).
-    t_eli = array.array(data_types.ARRAY_INT32)
-    edges_map = {}
-    edges_nbr = 0
-    if t_ls and t_pvi:
-        t_ls = set(t_ls)
-        todo_edges = [None] * len(me.edges) * 2
-        # Sigh, cannot access edge.key through foreach_get... :/
-        me.edges.foreach_get("vertices", todo_edges)
-        todo_edges = set((v1, v2) if v1 < v2 else (v2, v1) for v1, v2 in zip(*(iter(todo_edges),) * 2))
-
-        li = 0
-        vi = vi_start = t_pvi[0]
-        for li_next, vi_next in enumerate(t_pvi[1:] + t_pvi[:1], start=1):
-            if li_next in t_ls:  # End of a poly's loop.
-                vi2 = vi_start
-                vi_start = vi_next
-            else:
-                vi2 = vi_next
-
-            e_key = (vi, vi2) if vi < vi2 else (vi2, vi)
-            if e_key in todo_edges:
-                t_eli.append(li)
-                todo_edges.remove(e_key)
-                edges_map[e_key] = edges_nbr
-                edges_nbr += 1
-
-            vi = vi_next
-            li = li_next
-    # End of edges!
-
-    # We have to ^-1 last index of each loop.
-    for ls in t_ls:
-        t_pvi[ls - 1] ^= -1
-
-    # And finally we can write data!
-    elem_data_single_int32_array(geom, b"PolygonVertexIndex", t_pvi)
-    elem_data_single_int32_array(geom, b"Edges", t_eli)
-    del t_pvi
-    del t_ls
-    del t_eli
+    if np is not None:
+        t_pvi, t_eli, edges_vidx = fbx_data_mesh_polygons_edges_np(me, scene_data.settings.use_mesh_edges)
+        edges_nbr = len(t_eli)
+        edges_map = {}
+        if smooth_type == 'EDGE':
+            edges_map = {e_key: idx for idx, e_key in enumerate(map(tuple, edges_vidx.tolist()))}
+        elem_data_single_int32_array(geom, b"PolygonVertexIndex", t_pvi)
+        elem_data_single_int32_array(geom, b"Edges", t_eli)
+        del t_pvi
+        del t_eli
+        del edges_vidx
+    else:
+        loop_nbr = len(me.loops)
+        t_pvi = array.array(data_types.ARRAY_INT32, (0,)) * loop_nbr
+        t_ls = [None] * len(me.polygons)
+
+        me.loops.foreach_get("vertex_index", t_pvi)
+        me.polygons.foreach_get("loop_start", t_ls)
+
+        # Add "fake" faces for loose edges.
+        if scene_data.settings.use_mesh_edges:
+            t_le = tuple(e.vertices for e in me.edges if e.is_loose)
+            t_pvi.extend(chain(*t_le))
+            t_ls.extend(range(loop_nbr, loop_nbr + len(t_le), 2))
+            del t_le
+
+        # Edges...
+        t_eli = array.array(data_types.ARRAY_INT32)
+        edges_map = {}
+        edges_nbr = 0
+        if t_ls and t_pvi:
+            t_ls = set(t_ls)
+            todo_edges = [None] * len(me.edges) * 2
+            # Sigh, cannot access edge.key through foreach_get... :/
+            me.edges.foreach_get("vertices", todo_edges)
+            todo_edges = set((v1, v2) if v1 < v2 else (v2, v1) for v1, v2 in zip(*(iter(todo_edges),) * 2))
+
+            li = 0
+            vi = vi_start = t_pvi[0]
+            for li_next, vi_next in enumerate(t_pvi[1:] + t_pvi[:1], start=1):
+                if li_next in t_ls:  # End of a poly's loop.
+                    vi2 = vi_start
+                    vi_start = vi_next
+                else:
+                    vi2 = vi_next
+
+                e_key = (vi, vi2) if vi < vi2 else (vi2, vi)
+                if e_key in todo_edges:
+                    t_eli.append(li)
+                    todo_edges.remove(e_key)
+                    edges_map[e_key] = edges_nbr
+                    edges_nbr += 1
+
+                vi = vi_next
+                li = li_next
+        # End of edges!
+
+        # We have to ^-1 last index of each loop.
+        for ls in t_ls:
+            t_pvi[ls - 1] ^= -1
+
+        # And finally we can write data!
+        elem_data_single_int32_array(geom, b"PolygonVertexIndex", t_pvi)
+        elem_data_single_int32_array(geom, b"Edges", t_eli)
+        del t_pvi
+        del t_ls
+        del t_eli
 
     # And now, layers!
 
@@ -981,9 +1292,14 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
         #     but this does not seem well supported by apps currently...
         me.calc_normals_split()
 
-        t_ln = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 3
-        me.loops.foreach_get("normal", t_ln)
-        t_ln = nors_transformed_gen(t_ln, geom_mat_no)
+        if np is not None:
+            t_ln = np.empty(len(me.loops) * 3, dtype=np.float32)
+            me.loops.foreach_get("normal", t_ln)
+            t_ln = nors_transformed_array(t_ln, geom_mat_no)
+        else:
+            t_ln = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 3
+            me.loops.foreach_get("normal", t_ln)
+            t_ln = nors_transformed_gen(t_ln, geom_mat_no)
         if 0:
             t_ln = tuple(t_ln)  # No choice... :/
 
@@ -1010,7 +1326,7 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
             elem_data_single_string(lay_nor, b"Name", b"")
             elem_data_single_string(lay_nor, b"MappingInformationType", b"ByPolygonVertex")
             elem_data_single_string(lay_nor, b"ReferenceInformationType", b"Direct")
-            elem_data_single_float64_array(lay_nor, b"Normals", chain(*t_ln))
+            elem_data_single_float64_array(lay_nor, b"Normals", t_ln if np is not None else chain(*t_ln))
             # Normal weights, no idea what it is.
             # t_ln = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops)
             # elem_data_single_float64_array(lay_nor, b"NormalsW", t_ln)
@@ -1020,7 +1336,12 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
         if scene_data.settings.use_tspace:
             tspacenumber = len(me.uv_layers)
             if tspacenumber:
-                t_ln = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 3
+                if np is not None:
+                    t_ln = np.empty(len(me.loops) * 3, dtype=np.float32)
+                    _nors_transformed = nors_transformed_array
+                else:
+                    t_ln = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 3
+                    _nors_transformed = lambda raw_nors, m: chain(*nors_transformed_gen(raw_nors, m))
                 # t_lnw = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops)
                 for idx, uvlayer in enumerate(me.uv_layers):
                     name = uvlayer.name
@@ -1033,8 +1354,7 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
                     elem_data_single_string_unicode(lay_nor, b"Name", name)
                     elem_data_single_string(lay_nor, b"MappingInformationType", b"ByPolygonVertex")
                     elem_data_single_string(lay_nor, b"ReferenceInformationType", b"Direct")
-                    elem_data_single_float64_array(lay_nor, b"Binormals",
-                                                   chain(*nors_transformed_gen(t_ln, geom_mat_no)))
+                    elem_data_single_float64_array(lay_nor, b"Binormals", _nors_transformed(t_ln, geom_mat_no))
                     # Binormal weights, no idea what it is.
                     # elem_data_single_float64_array(lay_nor, b"BinormalsW", t_lnw)
 
@@ -1046,13 +1366,13 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
                     elem_data_single_string_unicode(lay_nor, b"Name", name)
                     elem_data_single_string(lay_nor, b"MappingInformationType", b"ByPolygonVertex")
                     elem_data_single_string(lay_nor, b"ReferenceInformationType", b"Direct")
-                    elem_data_single_float64_array(lay_nor, b"Tangents",
-                                                   chain(*nors_transformed_gen(t_ln, geom_mat_no)))
+                    elem_data_single_float64_array(lay_nor, b"Tangents", _nors_transformed(t_ln, geom_mat_no))
                     # Tangent weights, no idea what it is.
                     # elem_data_single_float64_array(lay_nor, b"TangentsW", t_lnw)
 
                 del t_ln
                 # del t_lnw
+                del _nors_transformed
                 me.free_tangents()
 
         me.free_normals_split()
@@ -1063,7 +1383,10 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
         def _coltuples_gen(raw_cols):
             return zip(*(iter(raw_cols),) * 3 + (_infinite_gen(1.0),))  # We need a fake alpha...
 
-        t_lc = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 3
+        if np is not None:
+            t_lc = np.empty(len(me.loops) * 3, dtype=np.float32)
+        else:
+            t_lc = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 3
         for colindex, collayer in enumerate(me.vertex_colors):
             collayer.data.foreach_get("color", t_lc)
             lay_vcol = elem_data_single_int32(geom, b"LayerElementColor", colindex)
@@ -1072,11 +1395,19 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
             elem_data_single_string(lay_vcol, b"MappingInformationType", b"ByPolygonVertex")
             elem_data_single_string(lay_vcol, b"ReferenceInformationType", b"IndexToDirect")
 
-            col2idx = tuple(set(_coltuples_gen(t_lc)))
-            elem_data_single_float64_array(lay_vcol, b"Colors", chain(*col2idx))  # Flatten again...
+            if np is not None:
+                t_col = np.ones((len(me.loops), 4), dtype=np.float64)  # We need a fake alpha...
+                t_col[:, :3] = t_lc.reshape(-1, 3)
+                col2idx, t_colidx = fbx_data_mesh_loops_indexed_np(t_col, 4)
+                elem_data_single_float64_array(lay_vcol, b"Colors", col2idx)
+                elem_data_single_int32_array(lay_vcol, b"ColorIndex", t_colidx)
+                del t_col, t_colidx
+            else:
+                col2idx = tuple(set(_coltuples_gen(t_lc)))
+                elem_data_single_float64_array(lay_vcol, b"Colors", chain(*col2idx))  # Flatten again...
 
-            col2idx = {col: idx for idx, col in enumerate(col2idx)}
-            elem_data_single_int32_array(lay_vcol, b"ColorIndex", (col2idx[c] for c in _coltuples_gen(t_lc)))
+                col2idx = {col: idx for idx, col in enumerate(col2idx)}
+                elem_data_single_int32_array(lay_vcol, b"ColorIndex", (col2idx[c] for c in _coltuples_gen(t_lc)))
             del col2idx
         del t_lc
         del _coltuples_gen
@@ -1089,7 +1420,10 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
         def _uvtuples_gen(raw_uvs):
             return zip(*(iter(raw_uvs),) * 2)
 
-        t_luv = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 2
+        if np is not None:
+            t_luv = np.empty(len(me.loops) * 2, dtype=np.float32)
+        else:
+            t_luv = array.array(data_types.ARRAY_FLOAT64, (0.0,)) * len(me.loops) * 2
         for uvindex, uvlayer in enumerate(me.uv_layers):
             uvlayer.data.foreach_get("uv", t_luv)
             lay_uv = elem_data_single_int32(geom, b"LayerElementUV", uvindex)
@@ -1098,11 +1432,17 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
             elem_data_single_string(lay_uv, b"MappingInformationType", b"ByPolygonVertex")
             elem_data_single_string(lay_uv, b"ReferenceInformationType", b"IndexToDirect")
 
-            uv2idx = tuple(set(_uvtuples_gen(t_luv)))
-            elem_data_single_float64_array(lay_uv, b"UV", chain(*uv2idx))  # Flatten again...
+            if np is not None:
+                uv2idx, t_uvidx = fbx_data_mesh_loops_indexed_np(t_luv, 2)
+                elem_data_single_float64_array(lay_uv, b"UV", uv2idx)
+                elem_data_single_int32_array(lay_uv, b"UVIndex", t_uvidx)
+                del t_uvidx
+            else:
+                uv2idx = tuple(set(_uvtuples_gen(t_luv)))
+                elem_data_single_float64_array(lay_uv, b"UV", chain(*uv2idx))  # Flatten again...
 
-            uv2idx = {uv: idx for idx, uv in enumerate(uv2idx)}
-            elem_data_single_int32_array(lay_uv, b"UVIndex", (uv2idx[uv] for uv in _uvtuples_gen(t_luv)))
+                uv2idx = {uv: idx for idx, uv in enumerate(uv2idx)}
+                elem_data_single_int32_array(lay_uv, b"UVIndex", (uv2idx[uv] for uv in _uvtuples_gen(t_luv)))
             del uv2idx
         del t_luv
         del _uvtuples_gen
@@ -1200,6 +1540,9 @@ def fbx_data_mesh_elements(root, me_obj, scene_data, done_meshes):
     elem_props_template_finalize(tmpl, props)
     done_meshes.add(me_key)
 
+    if geom_cache_key is not None:
+        geom_cache.put(geom_cache_key, geom)
+
 
 def check_skip_material(mat):
     """Simple helper to check whether we actually support exporting that material or not"""
@@ -1398,6 +1741,82 @@ def fbx_data_video_elements(root, vid, scene_data):
         #~ elem_data_single_bytes(fbx_vid, b"Content", b"")
 
 
+def fbx_data_skin_weights(me, valid_idxs, max_influences=0):
+    """
+    Return a dict {vgroup index: (vertex indices, weights)} of the non-null weights of given mesh's vertices
+    in given vertex groups (ordered by vertex index).
+    When max_influences is not zero, only the highest weights of each vertex are kept, scaled so that their sum remains
+    the same.
+    """
+    vgroups = {}
+    for idx, v in enumerate(me.vertices):
+        vgs = sorted(((vg.group, vg.weight) for vg in v.groups if vg.weight and vg.group in valid_idxs),
+                     key=lambda e: e[1], reverse=True)
+        if max_influences and len(vgs) > max_influences:
+            weights_sum = sum(w for _vg_idx, w in vgs)
+            vgs = vgs[:max_influences]
+            fac = weights_sum / sum(w for _vg_idx, w in vgs)
+            vgs = [(vg_idx, w * fac) for vg_idx, w in vgs]
+        for vg_idx, w in vgs:
+            indices, weights = vgroups.setdefault(vg_idx, ([], []))
+            indices.append(idx)
+            weights.append(w)
+    return vgroups
+
+
+def fbx_data_skin_weights_np(me, valid_idxs, max_influences=0):
+    """
+    NumPy version of fbx_data_skin_weights(), (vertex indices, weights) being NumPy arrays.
+    All vertex groups assignments are gathered once in flat arrays, then split by vertex group.
+    """
+    v_nbr = len(me.vertices)
+    v_groups_nbr = np.fromiter((len(v.groups) for v in me.vertices), dtype=np.int32, count=v_nbr)
+    vg_nbr = int(v_groups_nbr.sum())
+    # Note: there is no foreach_get access to vertex groups of all vertices at once, so we still have to loop here.
+    v_groups = np.fromiter((vg_elem for v in me.vertices for vg in v.groups for vg_elem in (vg.group, vg.weight)),
+                           dtype=np.float64, count=vg_nbr * 2).reshape(-1, 2)
+    vg_idx = v_groups[:, 0].astype(np.int32)
+    vg_weight = v_groups[:, 1]
+    v_idx = np.repeat(np.arange(v_nbr, dtype=np.int32), v_groups_nbr)
+
+    valid_lut = np.zeros(max(valid_idxs, default=-1) + 1, dtype=np.bool_)
+    valid_lut[list(valid_idxs)] = True
+    valid = (vg_weight != 0.0) & (vg_idx < len(valid_lut))
+    valid[valid] = valid_lut[vg_idx[valid]]
+    vg_idx = vg_idx[valid]
+    vg_weight = vg_weight[valid]
+    v_idx = v_idx[valid]
+
+    if max_influences:
+        # Sort by vertex, then by decreasing weight, and only keep the max_influences first items of each vertex.
+        order = np.lexsort((-vg_weight, v_idx))
+        vg_idx = vg_idx[order]
+        vg_weight = vg_weight[order]
+        v_idx = v_idx[order]
+        v_starts = np.flatnonzero(np.concatenate(((True,), v_idx[1:] != v_idx[:-1])))
+        v_counts = np.diff(np.concatenate((v_starts, (len(v_idx),))))
+        rank = np.arange(len(v_idx)) - np.repeat(v_starts, v_counts)
+        if np.any(rank >= max_influences):
+            weights_sum = np.bincount(v_idx, weights=vg_weight, minlength=v_nbr)
+            keep = rank < max_influences
+            vg_idx = vg_idx[keep]
+            vg_weight = vg_weight[keep]
+            v_idx = v_idx[keep]
+            # Scale kept weights, so that the sum of weights of each vertex remains the same.
+            fac = weights_sum / np.maximum(np.bincount(v_idx, weights=vg_weight, minlength=v_nbr), 1e-30)
+            vg_weight = vg_weight * fac[v_idx]
+
+    # Split per vertex group (stable sort keeps vertices in increasing order within each group).
+    order = np.argsort(vg_idx, kind='mergesort')
+    vg_idx = vg_idx[order]
+    vg_weight = vg_weight[order]
+    v_idx = v_idx[order]
+    vg_uniq, vg_starts = np.unique(vg_idx, return_index=True)
+    vg_ends = np.concatenate((vg_starts[1:], (len(vg_idx),)))
+    return {int(vg): (v_idx[start:end], vg_weight[start:end])
+            for vg, start, end in zip(vg_uniq, vg_starts, vg_ends)}
+
+
 def fbx_data_armature_elements(root, arm_obj, scene_data):
     """
     Write:
@@ -1457,13 +1876,10 @@ def fbx_data_armature_elements(root, arm_obj, scene_data):
             bo_vg_idx = {bo_obj.bdata.name: ob.vertex_groups[bo_obj.bdata.name].index
                          for bo_obj in clusters.keys() if bo_obj.bdata.name in ob.vertex_groups}
             valid_idxs = set(bo_vg_idx.values())
-            vgroups = {vg.index: OrderedDict() for vg in ob.vertex_groups}
-            verts_vgroups = (sorted(((vg.group, vg.weight) for vg in v.groups if vg.weight and vg.group in valid_idxs),
-                                    key=lambda e: e[1], reverse=True)
-                             for v in me.vertices)
-            for idx, vgs in enumerate(verts_vgroups):
-                for vg_idx, w in vgs:
-                    vgroups[vg_idx][idx] = w
+            if np is not None:
+                vgroups = fbx_data_skin_weights_np(me, valid_idxs, scene_data.settings.max_bone_influences)
+            else:
+                vgroups = fbx_data_skin_weights(me, valid_idxs, scene_data.settings.max_bone_influences)
 
             for bo_obj, clstr_key in clusters.items():
                 bo = bo_obj.bdata
@@ -1471,7 +1887,7 @@ def fbx_data_armature_elements(root, arm_obj, scene_data):
                 # Note we still write a cluster for bones not affecting the mesh, to get 'rest pose' data
                 # (the TransformBlah matrices).
                 vg_idx = bo_vg_idx.get(bo.name, None)
-                indices, weights = ((), ()) if vg_idx is None or not vgroups[vg_idx] else zip(*vgroups[vg_idx].items())
+                indices, weights = vgroups.get(vg_idx, ((), ()))
 
                 # Create the cluster.
                 fbx_clstr = elem_data_single_int64(root, b"Deformer", get_fbx_uuid_from_key(clstr_key))
@@ -1482,7 +1898,7 @@ def fbx_data_armature_elements(root, arm_obj, scene_data):
                 # No idea what that user data might be...
                 fbx_userdata = elem_data_single_string(fbx_clstr, b"UserData", b"")
                 fbx_userdata.add_string(b"")
-                if indices:
+                if len(indices):
                     elem_data_single_int32_array(fbx_clstr, b"Indexes", indices)
                     elem_data_single_float64_array(fbx_clstr, b"Weights", weights)
                 # Transform, TransformLink and TransformAssociateModel matrices...
@@ -2758,35 +3174,48 @@ def fbx_definitions_elements(root, scene_data):
     fbx_templates_generate(definitions, scene_data.templates)
 
 
-def fbx_objects_elements(root, scene_data):
+def fbx_objects_elements(root, scene_data, writer=None):
     """
     Data (objects, geometry, material, textures, armatures, etc.).
+    If writer (an encode_bin.FBXStreamWriter) is given, elements are written to file as soon as generated.
     """
     perfmon = PerfMon()
     perfmon.level_up()
-    objects = elem_empty(root, b"Objects")
+    if writer is None:
+        objects = elem_empty(root, b"Objects")
+        flush = lambda: None
+    else:
+        objects = writer.begin_elem(b"Objects")
+        flush = writer.flush
 
     perfmon.step("FBX export fetch empties (%d)..." % len(scene_data.data_empties))
 
     for empty in scene_data.data_empties:
         fbx_data_empty_elements(objects, empty, scene_data)
+    flush()
 
     perfmon.step("FBX export fetch lamps (%d)..." % len(scene_data.data_lamps))
 
     for lamp in scene_data.data_lamps:
         fbx_data_lamp_elements(objects, lamp, scene_data)
+    flush()
 
     perfmon.step("FBX export fetch cameras (%d)..." % len(scene_data.data_cameras))
 
     for cam in scene_data.data_cameras:
         fbx_data_camera_elements(objects, cam, scene_data)
+    flush()
 
     perfmon.step("FBX export fetch meshes (%d)..."
                  % len({me_key for me_key, _me, _free in scene_data.data_meshes.values()}))
 
     done_meshes = set()
     for me_obj in scene_data.data_meshes:
+        # Previous mesh is only written now, so that its arrays get compressed in background while this one
+        # is generated.
+        flush()
         fbx_data_mesh_elements(objects, me_obj, scene_data, done_meshes)
+    flush()
     del done_meshes
 
     perfmon.step("FBX export fetch objects (%d)..." % len(scene_data.objects))
@@ -2801,6 +3230,7 @@ def fbx_objects_elements(root, scene_data):
                 continue
             fbx_data_object_elements(objects, dp_obj, scene_data)
         ob_obj.dupli_list_clear()
+        flush()
 
     perfmon.step("FBX export fetch remaining...")
 
@@ -2826,6 +3256,9 @@ def fbx_objects_elements(root, scene_data):
 
     fbx_data_animation_elements(objects, scene_data)
 
+    if writer is not None:
+        writer.end_elem()
+
     perfmon.level_down()
 
 
@@ -2886,6 +3319,7 @@ def save_single(operator, scene, filepath="",
                 bake_anim_simplify_factor=1.0,
                 bake_anim_force_startend_keying=True,
                 add_leaf_bones=False,
+                max_bone_influences=0,
                 primary_bone_axis='Y',
                 secondary_bone_axis='X',
                 use_metadata=True,
@@ -2896,8 +3330,21 @@ def save_single(operator, scene, filepath="",
                 use_custom_props=False,
                 bake_space_transform=False,
                 armature_nodetype='NULL',
+                compression_level=1,
+                compression_policy=None,
+                geometry_cache_dir="",
+                geometry_cache_size=1024,
+                use_incremental=False,
                 **kwargs
                 ):
+    """
+    compression_policy is an optional encode_bin.FBXCompressionPolicy, overriding compression_level.
+    geometry_cache_dir enables a persistent cache of encoded mesh geometries in that directory, limited to
+    geometry_cache_size megabytes.
+    use_incremental reuses geometries of unchanged meshes from the previous export into the same filepath,
+    see FBXIncrementalGeometries.
+    max_bone_influences, when not zero, limits the number of bones deforming each vertex of skinned meshes.
+    """
 
     # Clear cached ObjectWrappers (just in case...).
     ObjectWrapper.cache_clear()
@@ -2954,16 +3401,27 @@ def save_single(operator, scene, filepath="",
         set(),  # embedded_set
     )
 
+    geometry_cache = None
+    if geometry_cache_dir:
+        geometry_cache = encode_bin.FBXElemDiskCache(bpy.path.abspath(geometry_cache_dir),
+                                                     geometry_cache_size * 1024 * 1024)
+    incremental = None
+    if use_incremental:
+        incremental = geometry_cache = FBXIncrementalGeometries(filepath, geometry_cache)
+    # Never leave a truncated file in place of a previous valid one (also, in incremental mode, previous file is read
+    # while exporting), file is only moved to filepath once fully written.
+    filepath_write = filepath + ".tmp"
+
     settings = FBXExportSettings(
         operator.report, (axis_up, axis_forward), global_matrix, global_scale, apply_unit_scale, unit_scale,
         bake_space_transform, global_matrix_inv, global_matrix_inv_transposed,
         context_objects, object_types, use_mesh_modifiers, use_mesh_modifiers_render,
         mesh_smooth_type, use_mesh_edges, use_tspace,
         armature_nodetype, use_armature_deform_only,
-        add_leaf_bones, bone_correction_matrix, bone_correction_matrix_inv,
+        add_leaf_bones, max_bone_influences, bone_correction_matrix, bone_correction_matrix_inv,
         bake_anim, bake_anim_use_all_bones, bake_anim_use_nla_strips, bake_anim_use_all_actions,
         bake_anim_step, bake_anim_simplify_factor, bake_anim_force_startend_keying,
-        False, media_settings, use_custom_props,
+        False, media_settings, use_custom_props, geometry_cache,
     )
 
     import bpy_extras.io_utils
@@ -2974,33 +3432,53 @@ def save_single(operator, scene, filepath="",
     # Generate some data about exported scene...
     scene_data = fbx_data_from_scene(scene, settings)
 
-    root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
-
-    # Mostly FBXHeaderExtension and GlobalSettings.
-    fbx_header_elements(root, scene_data)
-
-    # Documents and References are pretty much void currently.
-    fbx_documents_elements(root, scene_data)
-    fbx_references_elements(root, scene_data)
-
-    # Templates definitions.
-    fbx_definitions_elements(root, scene_data)
-
-    # Actual data.
-    fbx_objects_elements(root, scene_data)
-
-    # How data are inter-connected.
-    fbx_connections_elements(root, scene_data)
-
-    # Animation.
-    fbx_takes_elements(root, scene_data)
+    if compression_policy is None:
+        compression_policy = encode_bin.FBXCompressionPolicy(level=compression_level)
+    prev_compression_policy = encode_bin.set_compression_policy(compression_policy)
+    # Big arrays are compressed in worker threads while next elements are generated.
+    compression_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    prev_compression_executor = encode_bin.set_compression_executor(compression_executor)
+    try:
+        # Elements are written as soon as they are generated, instead of building the whole tree in memory first.
+        with encode_bin.FBXStreamWriter(filepath_write, FBX_VERSION) as writer:
+            root = writer.root  # Root element has no id, as it is not saved per se!
+
+            # Mostly FBXHeaderExtension and GlobalSettings.
+            fbx_header_elements(root, scene_data)
+
+            # Documents and References are pretty much void currently.
+            fbx_documents_elements(root, scene_data)
+            fbx_references_elements(root, scene_data)
+
+            # Templates definitions.
+            fbx_definitions_elements(root, scene_data)
+
+            # Actual data.
+            fbx_objects_elements(root, scene_data, writer)
+
+            # How data are inter-connected.
+            fbx_connections_elements(root, scene_data)
+
+            # Animation.
+            fbx_takes_elements(root, scene_data)
+    except BaseException:
+        if os.path.exists(filepath_write):
+            os.remove(filepath_write)
+        raise
+    finally:
+        encode_bin.set_compression_policy(prev_compression_policy)
+        encode_bin.set_compression_executor(prev_compression_executor)
+        compression_executor.shutdown()
+        if incremental is not None:
+            incremental.close()
+
+    os.replace(filepath_write, filepath)
+    if incremental is not None:
+        incremental.write_manifest()
 
     # Cleanup!
     fbx_scene_data_cleanup(scene_data)
 
-    # And we are down, we can write the whole thing!
-    encode_bin.write(filepath, root, FBX_VERSION)
-
     # Clear cached ObjectWrappers!
     ObjectWrapper.cache_clear()
 
@@ -3008,6 +3486,8 @@ def save_single(operator, scene, filepath="",
     if not media_settings.embed_textures:
         bpy_extras.io_utils.path_reference_copy(media_settings.copy_set)
 
+    if geometry_cache is not None:
+        print('geometry cache: %d hits, %d misses' % (geometry_cache.hits, geometry_cache.misses))
     print('export finished in %.4f sec.' % (time.process_time() - start_time))
     return {'FINISHED'}
 
@@ -3052,17 +3532,193 @@ def defaults_unity3d():
     }
 
 
+def save_batch_item(operator, data, batch_mode, fbxpath, prefix, use_batch_own_dir, kwargs):
+    """
+    Export a single scene or group of a batch export, see save().
+    """
+    newname = "_".join((prefix, bpy.path.clean_name(data.name))) if prefix else bpy.path.clean_name(data.name)
+
+    new_fbxpath = fbxpath
+    if use_batch_own_dir:
+        new_fbxpath = os.path.join(fbxpath, newname)
+        # path may already exist (also when exporting in parallel processes).
+        # TODO - might exist but be a file. unlikely but should probably account for it.
+        os.makedirs(new_fbxpath, exist_ok=True)
+
+    filepath = os.path.join(new_fbxpath, newname + '.fbx')
+
+    print('\nBatch exporting %s as...\n\t%r' % (data, filepath))
+
+    if batch_mode == 'GROUP':  # group
+        # group, so objects update properly, add a dummy scene.
+        scene = bpy.data.scenes.new(name="FBX_Temp")
+        scene.layers = [True] * 20
+        # bpy.data.scenes.active = scene # XXX, cant switch
+        src_scenes = {}  # Count how much each 'source' scenes are used.
+        for ob_base in data.objects:
+            for src_sce in ob_base.users_scene:
+                if src_sce not in src_scenes:
+                    src_scenes[src_sce] = 0
+                src_scenes[src_sce] += 1
+            scene.objects.link(ob_base)
+
+        # Find the 'most used' source scene, and use its unit settings. This is somewhat weak, but should work
+        # fine in most cases, and avoids stupid issues like T41931.
+        best_src_scene = None
+        best_src_scene_users = -1
+        for sce, nbr_users in src_scenes.items():
+            if (nbr_users) > best_src_scene_users:
+                best_src_scene_users = nbr_users
+                best_src_scene = sce
+        scene.unit_settings.system = best_src_scene.unit_settings.system
+        scene.unit_settings.system_rotation = best_src_scene.unit_settings.system_rotation
+        scene.unit_settings.scale_length = best_src_scene.unit_settings.scale_length
+
+        scene.update()
+        # TODO - BUMMER! Armatures not in the group wont animate the mesh
+    else:
+        scene = data
+
+    kwargs_batch = kwargs.copy()
+    kwargs_batch["context_objects"] = data.objects
+
+    try:
+        save_single(operator, scene, filepath, **kwargs_batch)
+    finally:
+        if batch_mode == 'GROUP':
+            # remove temp group scene
+            bpy.data.scenes.remove(scene)
+
+
+# Prefix of the lines batch worker processes print to report their progress to the main Blender process.
+_BATCH_WORKER_TAG = "FBX_BATCH_WORKER: "
+
+
+class _BatchWorkerOperator:
+    """Stand-in for the export operator in batch worker processes, only used for reports."""
+    def report(self, type, message):
+        print("%s: %s" % ("/".join(sorted(type)), message))
+
+
+def save_batch_worker(job_filepath):
+    """
+    Entry point of batch worker processes (background Blender instances started by save_batch_parallel(),
+    with the saved .blend file loaded), export the scenes or groups listed in given job file.
+    """
+    with open(job_filepath, 'r', encoding='utf-8') as f:
+        job = json.load(f)
+
+    batch_mode = job["batch_mode"]
+    kwargs = job["kwargs"]
+    kwargs["global_matrix"] = Matrix(kwargs["global_matrix"])
+    if kwargs.get("object_types") is not None:
+        kwargs["object_types"] = set(kwargs["object_types"])
+    operator = _BatchWorkerOperator()
+    data_coll = bpy.data.groups if batch_mode == 'GROUP' else bpy.data.scenes
+
+    for data_idx, data_name in job["data"]:
+        try:
+            data = data_coll[data_idx]
+            if data.name != data_name:
+                raise Exception("%r not found in %r" % (data_name, bpy.data.filepath))
+            save_batch_item(operator, data, batch_mode, job["fbxpath"], job["prefix"], job["use_batch_own_dir"],
+                            kwargs)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            print(_BATCH_WORKER_TAG + json.dumps(("FAILED", data_name, str(e))), flush=True)
+        else:
+            print(_BATCH_WORKER_TAG + json.dumps(("DONE", data_name, "")), flush=True)
+
+
+def save_batch_parallel(operator, batch_mode, data_seq, fbxpath, prefix, use_batch_own_dir, kwargs, batch_jobs):
+    """
+    Export given scenes or groups in batch_jobs background Blender processes, each one loading the saved .blend
+    file and exporting its share of data_seq (see save_batch_worker()).
+    Returns a dict {name: error message} of failed exports.
+    """
+    import subprocess
+    import tempfile
+    import threading
+
+    data_coll = bpy.data.groups if batch_mode == 'GROUP' else bpy.data.scenes
+    data_items = [(data_coll.find(data.name), data.name) for data in data_seq]
+    batch_jobs = min(batch_jobs, len(data_items))
+
+    kwargs = kwargs.copy()
+    kwargs["global_matrix"] = [list(row) for row in kwargs.get("global_matrix", Matrix())]
+    if kwargs.get("object_types") is not None:
+        kwargs["object_types"] = sorted(kwargs["object_types"])
+
+    addon_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    # Python drivers and such have to behave as in current Blender.
+    use_autoexec = bpy.context.user_preferences.system.use_scripts_auto_execute and not bpy.app.autoexec_fail
+    autoexec = "--enable-autoexec" if use_autoexec else "--disable-autoexec"
+    workers = []
+    for i in range(batch_jobs):
+        fd, job_filepath = tempfile.mkstemp(prefix="fbx_batch_", suffix=".json")
+        with open(fd, 'w', encoding='utf-8') as f:
+            json.dump({
+                "batch_mode": batch_mode,
+                "data": data_items[i::batch_jobs],
+                "fbxpath": fbxpath,
+                "prefix": prefix,
+                "use_batch_own_dir": use_batch_own_dir,
+                "kwargs": kwargs,
+            }, f)
+        expr = ("import sys, importlib; sys.path.insert(0, %r); "
+                "importlib.import_module(%r).save_batch_worker(%r)" % (addon_dir, __name__, job_filepath))
+        cmd = (bpy.app.binary_path, "--background", "--factory-startup", autoexec, bpy.data.filepath,
+               "--python-expr", expr)
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        workers.append((proc, job_filepath, data_items[i::batch_jobs]))
+
+    results = {}
+    lock = threading.Lock()
+    nbr_items = len(data_items)
+
+    def _read_worker_output(proc):
+        for line in proc.stdout:
+            line = line.decode('utf-8', 'replace').rstrip()
+            if not line.startswith(_BATCH_WORKER_TAG):
+                continue
+            status, name, msg = json.loads(line[len(_BATCH_WORKER_TAG):])
+            with lock:
+                results[name] = msg if status == "FAILED" else None
+                print("Batch export %d/%d: %s %s %s" % (len(results), nbr_items, name, status, msg))
+
+    threads = [threading.Thread(target=_read_worker_output, args=(proc,)) for proc, _fp, _items in workers]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    failed = {}
+    for proc, job_filepath, items in workers:
+        ret_code = proc.wait()
+        os.remove(job_filepath)
+        for _idx, name in items:
+            if name not in results:
+                failed[name] = "worker process exited with code %d" % ret_code
+            elif results[name] is not None:
+                failed[name] = results[name]
+    return failed
+
+
 def save(operator, context,
          filepath="",
          use_selection=False,
          use_visible = True,
          batch_mode='OFF',
          use_batch_own_dir=False,
+         batch_jobs=1,
          **kwargs
          ):
     """
     This is a wrapper around save_single, which handles multi-scenes (or groups) cases, when batch-exporting a whole
     .blend file.
+    With batch_jobs > 1, batch export is done in that many background Blender processes, which requires the .blend
+    file to be saved.
     """
 
     ret = None
@@ -3096,67 +3752,27 @@ def save(operator, context,
         else:
             data_seq = bpy.data.scenes
 
-        # call this function within a loop with BATCH_ENABLE == False
-        # no scene switching done at the moment.
-        # orig_sce = context.scene
-
-        new_fbxpath = fbxpath  # own dir option modifies, we need to keep an original
-        for data in data_seq:  # scene or group
-            newname = "_".join((prefix, bpy.path.clean_name(data.name))) if prefix else bpy.path.clean_name(data.name)
-
-            if use_batch_own_dir:
-                new_fbxpath = os.path.join(fbxpath, newname)
-                # path may already exist
-                # TODO - might exist but be a file. unlikely but should probably account for it.
-
-                if not os.path.exists(new_fbxpath):
-                    os.makedirs(new_fbxpath)
-
-            filepath = os.path.join(new_fbxpath, newname + '.fbx')
-
-            print('\nBatch exporting %s as...\n\t%r' % (data, filepath))
-
-            if batch_mode == 'GROUP':  # group
-                # group, so objects update properly, add a dummy scene.
-                scene = bpy.data.scenes.new(name="FBX_Temp")
-                scene.layers = [True] * 20
-                # bpy.data.scenes.active = scene # XXX, cant switch
-                src_scenes = {}  # Count how much each 'source' scenes are used.
-                for ob_base in data.objects:
-                    for src_sce in ob_base.users_scene:
-                        if src_sce not in src_scenes:
-                            src_scenes[src_sce] = 0
-                        src_scenes[src_sce] += 1
-                    scene.objects.link(ob_base)
-
-                # Find the 'most used' source scene, and use its unit settings. This is somewhat weak, but should work
-                # fine in most cases, and avoids stupid issues like T41931.
-                best_src_scene = None
-                best_src_scene_users = -1
-                for sce, nbr_users in src_scenes.items():
-                    if (nbr_users) > best_src_scene_users:
-                        best_src_scene_users = nbr_users
-                        best_src_scene = sce
-                scene.unit_settings.system = best_src_scene.unit_settings.system
-                scene.unit_settings.system_rotation = best_src_scene.unit_settings.system_rotation
-                scene.unit_settings.scale_length = best_src_scene.unit_settings.scale_length
-
-                scene.update()
-                # TODO - BUMMER! Armatures not in the group wont animate the mesh
-            else:
-                scene = data
-
-            kwargs_batch = kwargs.copy()
-            kwargs_batch["context_objects"] = data.objects
-
-            save_single(operator, scene, filepath, **kwargs_batch)
+        if batch_jobs > 1 and len(data_seq) > 1 and (not bpy.data.filepath or bpy.data.is_dirty):
+            # Worker processes load the .blend file from disk, they would not see unsaved changes.
+            operator.report({'WARNING'}, "Save the .blend file to batch export in parallel processes, "
+                                         "exporting from current Blender instead")
+            batch_jobs = 1
+
+        if batch_jobs > 1 and len(data_seq) > 1:
+            failed = save_batch_parallel(operator, batch_mode, data_seq, fbxpath, prefix, use_batch_own_dir, kwargs,
+                                         batch_jobs)
+            for name, msg in sorted(failed.items()):
+                operator.report({'ERROR'}, "Batch export of %r failed: %s" % (name, msg))
+        else:
+            # call this function within a loop with BATCH_ENABLE == False
+            # no scene switching done at the moment.
+            # orig_sce = context.scene
 
-            if batch_mode == 'GROUP':
-                # remove temp group scene
-                bpy.data.scenes.remove(scene)
+            for data in data_seq:  # scene or group
+                save_batch_item(operator, data, batch_mode, fbxpath, prefix, use_batch_own_dir, kwargs)
 
-        # no active scene changing!
-        # bpy.data.scenes.active = orig_sce
+            # no active scene changing!
+            # bpy.data.scenes.active = orig_sce
 
         ret = {'FINISHED'}  # so the script wont run after we have batch exported.
 
@@ -33,6 +33,12 @@ import bpy_extras
 from bpy.types import Object, Bone, PoseBone, DupliObject
 from mathutils import Vector, Matrix
 
+# NumPy is optional, we fall back to pure python code when it is not available.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 from . import encode_bin, data_types
 
 
@@ -280,6 +286,39 @@ def nors_transformed_gen(raw_nors, m=None):
     return gen if m is None else (m * Vector(v) for v in gen)
 
 
+def _mat4_vec3_array_mul(m, raw_vecs):
+    """
+    NumPy version of 'm * Vector(v)' for a whole flat array of 3D vectors, with m a 4D matrix.
+    Computes exactly what mathutils does (float products, summed as doubles, rounded back to float),
+    so that exported data remain bit-identical to the generators above.
+    """
+    m = np.array(m, dtype=np.float32)
+    vecs = np.asarray(raw_vecs, dtype=np.float32).reshape(-1, 3)
+    ret = np.empty(vecs.shape, dtype=np.float32)
+    dot = np.empty(len(vecs), dtype=np.float64)
+    for row in range(3):
+        dot[:] = 0.0
+        for col in range(3):
+            dot += m[row, col] * vecs[:, col]
+        dot += float(m[row, 3])
+        ret[:, row] = dot
+    return ret.reshape(-1)
+
+
+def vcos_transformed_array(raw_cos, m=None):
+    """NumPy counterpart of vcos_transformed_gen(), returns a flat float64 array."""
+    if m is None:
+        return np.asarray(raw_cos, dtype=np.float64).reshape(-1)
+    return _mat4_vec3_array_mul(m, raw_cos).astype(np.float64)
+
+
+def nors_transformed_array(raw_nors, m=None):
+    """NumPy counterpart of nors_transformed_gen(), returns a flat float64 array."""
+    if m is None:
+        return np.asarray(raw_nors, dtype=np.float64).reshape(-1)
+    return _mat4_vec3_array_mul(m, raw_nors).astype(np.float64)
+
+
 # ##### UIDs code. #####
 
 # ID class (mere int).
@@ -1195,11 +1234,11 @@ FBXExportSettings = namedtuple("FBXExportSettings", (
     "bake_space_transform", "global_matrix_inv", "global_matrix_inv_transposed",
     "context_objects", "object_types", "use_mesh_modifiers", "use_mesh_modifiers_render",
     "mesh_smooth_type", "use_mesh_edges", "use_tspace",
-    "armature_nodetype", "use_armature_deform_only", "add_leaf_bones",
+    "armature_nodetype", "use_armature_deform_only", "add_leaf_bones", "max_bone_influences",
     "bone_correction_matrix", "bone_correction_matrix_inv",
     "bake_anim", "bake_anim_use_all_bones", "bake_anim_use_nla_strips", "bake_anim_use_all_actions",
     "bake_anim_step", "bake_anim_simplify_factor", "bake_anim_force_startend_keying",
-    "use_metadata", "media_settings", "use_custom_props",
+    "use_metadata", "media_settings", "use_custom_props", "geometry_cache",
 ))
 
 # Helper container gathering some data we need multiple times:
@@ -35,6 +35,12 @@ if "bpy" in locals():
 import bpy
 from mathutils import Matrix, Euler, Vector
 
+# NumPy is optional, we fall back to pure python code when it is not available.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # -----
 # Utils
 from . import parse_fbx, fbx_utils
@@ -56,6 +62,10 @@ from .fbx_utils import (
 # global singleton, assign on execution
 fbx_elem_nil = None
 
+# Lookup tables of Properties70 elements, {key: (elem, {prop_id: P elem})}, see elem_props_index().
+# global singleton, reset on execution, and cleared once done (see load())
+fbx_elem_props_index = {}
+
 # Units convertors...
 convert_deg_to_rad_iter = units_convertor_iter("degree", "radian")
 
@@ -63,6 +73,9 @@ MAT_CONVERT_BONE = fbx_utils.MAT_CONVERT_BONE.inverted()
 MAT_CONVERT_LAMP = fbx_utils.MAT_CONVERT_LAMP.inverted()
 MAT_CONVERT_CAMERA = fbx_utils.MAT_CONVERT_CAMERA.inverted()
 
+# Value of 'LINEAR' interpolation of keyframes (for foreach_set).
+BEZT_IPO_LINEAR = 1
+
 
 def elem_find_first(elem, id_search, default=None):
     for fbx_item in elem.elems:
@@ -152,16 +165,43 @@ def elem_prop_first(elem, default=None):
     return elem.props[0] if (elem is not None) and elem.props else default
 
 
+def elem_prop_array_as_np(data, dtype=None):
+    """
+    Return given FBX array property as a NumPy array of given dtype (without copying it when possible).
+    """
+    if type(data) is parse_fbx.FBXLazyArray:
+        data = data.get()
+    data = np.asarray(memoryview(data))
+    return data if dtype is None else data.astype(dtype, copy=False)
+
+
 # ----
 # Support for
 # Properties70: { ... P:
+def elem_props_index(elem):
+    """
+    Return the {prop_id: P elem} lookup table of given Properties70 element, built on first call
+    (first P element wins when a property is defined several times).
+    """
+    # Compact tree elements are views created on demand, those are identified by their tree node instead.
+    key = elem if elem.__class__ is parse_fbx.FBXCompactElem else id(elem)
+    entry = fbx_elem_props_index.get(key)
+    if entry is None:
+        index = {}
+        for subelem in reversed(elem.elems):
+            assert(subelem.id == b'P')
+            index[subelem.props[0]] = subelem
+        # Keep a reference to elem, so that its id cannot be reused by another element.
+        entry = fbx_elem_props_index[key] = (elem, index)
+    return entry[1]
+
+
 def elem_props_find_first(elem, elem_prop_id):
     if elem is None:
         # When properties are not found... Should never happen, but happens - as usual.
         return None
     # support for templates (tuple of elems)
-    if type(elem) is not FBXElem:
-        assert(type(elem) is tuple)
+    if type(elem) is tuple:
         for e in elem:
             result = elem_props_find_first(e, elem_prop_id)
             if result is not None:
@@ -169,11 +209,7 @@ def elem_props_find_first(elem, elem_prop_id):
         assert(len(elem) > 0)
         return None
 
-    for subelem in elem.elems:
-        assert(subelem.id == b'P')
-        if subelem.props[0] == elem_prop_id:
-            return subelem
-    return None
+    return elem_props_index(elem).get(elem_prop_id)
 
 
 def elem_props_get_color_rgb(elem, elem_prop_id, default=None):
@@ -539,6 +575,93 @@ def blen_read_animations_curves_iter(fbx_curves, blen_start_offset, fbx_start_of
         yield (curr_blenkframe, curr_values)
 
 
+def blen_read_animations_curves_resample(fbx_curves, blen_start_offset, fbx_start_offset, fps):
+    """
+    NumPy version of blen_read_animations_curves_iter(), evaluating all curves at once.
+    Return a (frames, values, valid) tuple: frames are the (blender) timings of all curves' keyframes, values and valid
+    are (len(fbx_curves), len(frames)) matrices of each curve's value at those frames, and whether it has one
+    (curves have no value after their last keyframe).
+    """
+    from .fbx_utils import FBX_KTIME
+    timefac = fps / FBX_KTIME
+
+    curves = []
+    for c in fbx_curves:
+        times = elem_prop_first(elem_find_first(c[2], b'KeyTime'))
+        values = elem_prop_first(elem_find_first(c[2], b'KeyValueFloat'))
+        if times is None or values is None:
+            curves.append((np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)))
+        else:
+            curves.append((elem_prop_array_as_np(times, np.int64), elem_prop_array_as_np(values, np.float64)))
+
+    allkeys = np.unique(np.concatenate([times for times, _values in curves] or [np.empty(0, dtype=np.int64)]))
+    curves_values = np.zeros((len(curves), len(allkeys)), dtype=np.float64)
+    curves_valid = np.zeros((len(curves), len(allkeys)), dtype=np.bool_)
+    for (times, values), curr_values, curr_valid in zip(curves, curves_values, curves_valid):
+        # Index of the first key of this curve at or after each time (len(times) when past its last key).
+        idx = np.searchsorted(times, allkeys, side='left')
+        curr_valid[:] = idx < len(times)
+        idx = idx[curr_valid]
+        idx_prev = np.maximum(idx - 1, 0)
+        times_prev = times[idx_prev]
+        values_prev = values[idx_prev]
+        # Same linear interpolation as blen_read_animations_curves_iter(), first value is used before first key.
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ifac = (allkeys[curr_valid] - times_prev) / (times[idx] - times_prev)
+            curr_values[curr_valid] = np.where(idx == 0, values[idx], (values[idx] - values_prev) * ifac + values_prev)
+
+    frames = (allkeys - fbx_start_offset) * timefac + blen_start_offset
+    return frames, curves_values, curves_valid
+
+
+def blen_read_animations_channel_np(values, valid, init_value):
+    """
+    Return the value of a channel at each frame, from the (values, valid) matrices of the curves animating it
+    (as returned by blen_read_animations_curves_resample()).
+    Last curve having a value at a frame wins, channel keeps its previous value (init_value at start) when none has.
+    """
+    frames_nbr = values.shape[1]
+    channel = np.empty(frames_nbr, dtype=np.float64)
+    is_set = np.zeros(frames_nbr, dtype=np.bool_)
+    for curr_values, curr_valid in zip(values, valid):
+        channel[curr_valid] = curr_values[curr_valid]
+        is_set |= curr_valid
+    idx = np.where(is_set, np.arange(frames_nbr), -1)
+    np.maximum.accumulate(idx, out=idx)
+    return np.where(idx >= 0, channel[idx], init_value)
+
+
+def blen_read_animations_fcurve_keys_set(fc, frames, values):
+    """
+    Add linear keyframes to given (empty) FCurve in one go, from NumPy arrays of frames and values.
+    Keyframes that insertion in 'NEEDED' mode would not keep are removed beforehand, i.e. inner keyframes of runs
+    of (almost) same values, using the same float comparison as Blender.
+    FCurve still has to be updated afterwards.
+    """
+    # That is what FCurves store.
+    values = values.astype(np.float32)
+    if len(values) > 2:
+        same = np.abs(np.diff(values)) < np.finfo(np.float32).eps
+        needed = np.ones(len(values), dtype=np.bool_)
+        needed[1:-1] = ~(same[:-1] & same[1:])
+        frames = frames[needed]
+        values = values[needed]
+
+    co = np.empty((len(values), 2), dtype=np.float32)
+    co[:, 0] = frames
+    co[:, 1] = values
+
+    keyframes = fc.keyframe_points
+    keyframes.add(len(co))
+    keyframes.foreach_set("co", co.ravel())
+    try:
+        keyframes.foreach_set("interpolation", np.full(len(co), BEZT_IPO_LINEAR, dtype=np.int32))
+    except (TypeError, RuntimeError):
+        # Older Blender versions do not support foreach access to enum properties.
+        for keyframe in keyframes:
+            keyframe.interpolation = 'LINEAR'
+
+
 def blen_read_animations_action_item(action, item, cnodes, fps, anim_offset):
     """
     'Bake' loc/rot/scale into the action,
@@ -586,16 +709,28 @@ def blen_read_animations_action_item(action, item, cnodes, fps, anim_offset):
     blen_curves = [action.fcurves.new(prop, channel, grpname)
                    for prop, nbr_channels, grpname in props for channel in range(nbr_channels)]
 
+    if np is not None:
+        frames, curves_values, curves_valid = blen_read_animations_curves_resample(fbx_curves, anim_offset, 0, fps)
+
     if isinstance(item, ShapeKey):
-        for frame, values in blen_read_animations_curves_iter(fbx_curves, anim_offset, 0, fps):
-            value = 0.0
-            for v, (fbxprop, channel, _fbx_acdata) in values:
+        if np is not None:
+            shape_values = np.zeros(len(frames), dtype=np.float64)
+            for (fbxprop, channel, _fbx_acdata), values, valid in zip(fbx_curves, curves_values, curves_valid):
                 assert(fbxprop == b'DeformPercent')
                 assert(channel == 0)
-                value = v / 100.0
+                shape_values[valid] = values[valid] / 100.0
+            for fc, values in zip(blen_curves, (shape_values,)):
+                blen_read_animations_fcurve_keys_set(fc, frames, values)
+        else:
+            for frame, values in blen_read_animations_curves_iter(fbx_curves, anim_offset, 0, fps):
+                value = 0.0
+                for v, (fbxprop, channel, _fbx_acdata) in values:
+                    assert(fbxprop == b'DeformPercent')
+                    assert(channel == 0)
+                    value = v / 100.0
 
-            for fc, v in zip(blen_curves, (value,)):
-                fc.keyframe_points.insert(frame, v, {'NEEDED', 'FAST'}).interpolation = 'LINEAR'
+                for fc, v in zip(blen_curves, (value,)):
+                    fc.keyframe_points.insert(frame, v, {'NEEDED', 'FAST'}).interpolation = 'LINEAR'
 
     else:  # Object or PoseBone:
         if item.is_bone:
@@ -609,14 +744,41 @@ def blen_read_animations_action_item(action, item, cnodes, fps, anim_offset):
         # Pre-compute inverted local rest matrix of the bone, if relevant.
         restmat_inv = item.get_bind_matrix().inverted_safe() if item.is_bone else None
 
-        for frame, values in blen_read_animations_curves_iter(fbx_curves, anim_offset, 0, fps):
-            for v, (fbxprop, channel, _fbx_acdata) in values:
-                if fbxprop == b'Lcl Translation':
-                    transform_data.loc[channel] = v
-                elif fbxprop == b'Lcl Rotation':
-                    transform_data.rot[channel] = v
-                elif fbxprop == b'Lcl Scaling':
-                    transform_data.sca[channel] = v
+        if np is not None:
+            # Values of each animated transform channel at each frame.
+            transform_channels = {b'Lcl Translation': transform_data.loc,
+                                  b'Lcl Rotation': transform_data.rot,
+                                  b'Lcl Scaling': transform_data.sca}
+            channels_curves = {}
+            for curve_idx, (fbxprop, channel, _fbx_acdata) in enumerate(fbx_curves):
+                if fbxprop in transform_channels:
+                    channels_curves.setdefault((fbxprop, channel), []).append(curve_idx)
+            tracks = [(transform_channels[fbxprop], channel,
+                       blen_read_animations_channel_np(curves_values[curves_idx], curves_valid[curves_idx],
+                                                       transform_channels[fbxprop][channel]).tolist())
+                      for (fbxprop, channel), curves_idx in channels_curves.items()]
+
+            # Keyframes are only added to FCurves at the end, in one go.
+            blen_curves_values = [[] for _fc in blen_curves]
+
+            def _gen():
+                for frame_idx, frame in enumerate(frames.tolist()):
+                    for data, channel, track in tracks:
+                        data[channel] = track[frame_idx]
+                    yield frame
+        else:
+            def _gen():
+                for frame, values in blen_read_animations_curves_iter(fbx_curves, anim_offset, 0, fps):
+                    for v, (fbxprop, channel, _fbx_acdata) in values:
+                        if fbxprop == b'Lcl Translation':
+                            transform_data.loc[channel] = v
+                        elif fbxprop == b'Lcl Rotation':
+                            transform_data.rot[channel] = v
+                        elif fbxprop == b'Lcl Scaling':
+                            transform_data.sca[channel] = v
+                    yield frame
+
+        for frame in _gen():
             mat, _, _ = blen_read_object_transform_do(transform_data)
 
             # compensate for changes in the local matrix during processing
@@ -645,10 +807,18 @@ def blen_read_animations_action_item(action, item, cnodes, fps, anim_offset):
             else:  # Euler
                 rot = rot.to_euler(rot_mode, rot_prev)
                 rot_prev = rot
-            for fc, value in zip(blen_curves, chain(loc, rot, sca)):
-                fc.keyframe_points.insert(frame, value, {'NEEDED', 'FAST'}).interpolation = 'LINEAR'
+            if np is not None:
+                for values, value in zip(blen_curves_values, chain(loc, rot, sca)):
+                    values.append(value)
+            else:
+                for fc, value in zip(blen_curves, chain(loc, rot, sca)):
+                    fc.keyframe_points.insert(frame, value, {'NEEDED', 'FAST'}).interpolation = 'LINEAR'
+
+        if np is not None:
+            for fc, values in zip(blen_curves, blen_curves_values):
+                blen_read_animations_fcurve_keys_set(fc, frames, np.array(values, dtype=np.float64))
 
-    # Since we inserted our keyframes in 'FAST' mode, we have to update the fcurves now.
+    # Since we inserted our keyframes in 'FAST' mode (or added them in bulk), we have to update the fcurves now.
     for fc in blen_curves:
         fc.update()
 
@@ -705,6 +875,137 @@ def blen_read_geom_layerinfo(fbx_layer):
         )
 
 
+class FBXGeomLayer:
+    """
+    A decoded FBX geometry layer: items to assign to given indices of some blender mesh data (as NumPy arrays).
+    """
+
+    __slots__ = ('length', 'indices', 'items')
+
+    def __init__(self, length):
+        self.length = length
+        self.indices = None
+        self.items = None
+
+    def __len__(self):
+        return self.length
+
+
+class FBXGeomData:
+    """
+    A decoded FBX mesh geometry, as flat NumPy buffers ready to be assigned to a new blender mesh.
+    """
+
+    __slots__ = (
+        'name', 'verts_co', 'loops_vidx', 'polys_loop_start', 'polys_loop_total', 'edges_vidx',
+        'layers', 'loops_normal', 'ok_smooth', 'use_auto_smooth', 'show_edge_sharp')
+
+    def __init__(self, name):
+        self.name = name
+        self.verts_co = np.empty(0, dtype=np.float32)
+        self.loops_vidx = np.empty(0, dtype=np.int32)
+        self.polys_loop_start = np.empty(0, dtype=np.int32)
+        self.polys_loop_total = np.empty(0, dtype=np.int32)
+        self.edges_vidx = np.empty(0, dtype=np.int32)
+        self.layers = []                        # (layer_type, layer_name, blen_attr, FBXGeomLayer) tuples.
+        self.loops_normal = None                # FBXGeomLayer, when custom normals are read.
+        self.ok_smooth = False
+        # Same as blender mesh settings.
+        self.use_auto_smooth = False
+        self.show_edge_sharp = False
+
+    def layer_len(self, layer_type):
+        if layer_type == 'VERTEX':
+            return len(self.verts_co) // 3
+        elif layer_type == 'EDGE':
+            return len(self.edges_vidx) // 2
+        elif layer_type == 'POLYGON':
+            return len(self.polys_loop_start)
+        return len(self.loops_vidx)  # 'LOOP', 'UV' and 'COLOR'.
+
+    def layer_new(self, layer_type, layer_name, blen_attr):
+        layer = FBXGeomLayer(self.layer_len(layer_type))
+        self.layers.append((layer_type, layer_name, blen_attr, layer))
+        return layer
+
+    def loops_normal_set(self, layer_type, layer):
+        """Store given normals layer as loops_normal, copying polygon or vertex normals to loop ones if needed."""
+        if layer_type != 'LOOP':
+            nors = np.zeros((layer.length, 3), dtype=np.float32)
+            nors[layer.indices] = layer.items
+            if layer_type == 'POLYGON':
+                loops_idx, polys_idx = blen_read_geom_polyloops_np(self)
+                layer.items = nors[polys_idx]
+            else:
+                loops_idx = np.arange(len(self.loops_vidx))
+                layer.items = nors[self.loops_vidx]
+            layer.length = len(self.loops_vidx)
+            layer.indices = loops_idx
+        self.loops_normal = layer
+
+
+def blen_read_geom_array_gather(mapping, blen_data, blen_attr, fbx_data, stride, item_size, descr, xform):
+    """
+    Bulk version of blen_read_geom_array_setattr, mapping is a pair of NumPy arrays (blen_indices, fbx_indices),
+    and blen_data a FBXGeomLayer.
+
+    All mapped items are gathered and transformed at once (xform hence gets and returns a whole array of items),
+    and stored in blen_data with their blender indices.
+    """
+    blen_idx, fbx_idx = mapping
+    blen_len = len(blen_data)
+    fbx_data = elem_prop_array_as_np(fbx_data)
+
+    # Negative values mean 'skip'.
+    valid = (fbx_idx >= 0) & (fbx_idx + item_size <= len(fbx_data))
+    if blen_idx.size and blen_idx.max() >= blen_len:
+        print("ERROR: too much data in this layer, compared to elements in mesh, skipping!")
+        valid &= blen_idx < blen_len
+    if not valid.all():
+        blen_idx = blen_idx[valid]
+        fbx_idx = fbx_idx[valid]
+
+    if item_size == 1:
+        items = fbx_data[fbx_idx]
+    else:
+        items = fbx_data[fbx_idx[:, None] + np.arange(item_size)]
+    if xform is not None:
+        items = xform(items)
+
+    blen_data.indices = blen_idx
+    blen_data.items = items
+
+
+def blen_read_geom_array_foreach_set(blen_data, blen_attr, indices, items):
+    """Assign items to given indices of blen_data (a bpy collection), with a single foreach_set."""
+    blen_len = len(blen_data)
+    if not (blen_len and len(indices)):
+        return
+    # Use the internal storage type of the property, so that foreach_get/set can access the buffer directly.
+    dtype = {'BOOLEAN': np.bool_, 'INT': np.int32, 'FLOAT': np.float32}[
+        blen_data[0].bl_rna.properties[blen_attr].type]
+    if len(indices) == blen_len and np.array_equal(indices, np.arange(blen_len)):
+        blen_buf = np.ascontiguousarray(items, dtype=dtype).ravel()
+    else:
+        # Get current values first, so that skipped items are left untouched.
+        blen_buf = np.empty(blen_len * (items.size // len(items)), dtype=dtype)
+        blen_data.foreach_get(blen_attr, blen_buf)
+        blen_buf.reshape(blen_len, -1)[indices] = items.reshape(len(indices), -1)
+    blen_data.foreach_set(blen_attr, blen_buf)
+
+
+def blen_read_geom_array_set(mapping, blen_data, blen_attr, fbx_data, stride, item_size, descr, xform):
+    """
+    Generic fbx_layer to blen_data setter, mapping being as returned by blen_read_geom_array_gen_* functions.
+
+    With NumPy, mapping is a pair of index arrays and blen_data a FBXGeomLayer (see blen_read_geom_array_gather),
+    otherwise mapping yields tuples (ble_idx, fbx_idx) (see blen_read_geom_array_setattr).
+    """
+    if np is not None:
+        return blen_read_geom_array_gather(mapping, blen_data, blen_attr, fbx_data, stride, item_size, descr, xform)
+    return blen_read_geom_array_setattr(mapping, blen_data, blen_attr, fbx_data, stride, item_size, descr, xform)
+
+
 def blen_read_geom_array_setattr(generator, blen_data, blen_attr, fbx_data, stride, item_size, descr, xform):
     """Generic fbx_layer to blen_data setter, generator is expected to yield tuples (ble_idx, fbx_idx)."""
     max_idx = len(blen_data) - 1
@@ -758,22 +1059,40 @@ def blen_read_geom_array_setattr(generator, blen_data, blen_attr, fbx_data, stri
         _process(blen_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx)
 
 
-# generic generators.
+# generic generators, see blen_read_geom_array_set.
+# When NumPy is available, those return a pair of index arrays (blen_indices, fbx_indices) instead.
 def blen_read_geom_array_gen_allsame(data_len):
+    if np is not None:
+        return np.arange(data_len), np.zeros(data_len, dtype=np.intp)
     return zip(*(range(data_len), (0,) * data_len))
 
 
 def blen_read_geom_array_gen_direct(fbx_data, stride):
     fbx_data_len = len(fbx_data)
+    if np is not None:
+        return np.arange(fbx_data_len // stride), np.arange(0, fbx_data_len - stride + 1, stride)
     return zip(*(range(fbx_data_len // stride), range(0, fbx_data_len, stride)))
 
 
 def blen_read_geom_array_gen_indextodirect(fbx_layer_index, stride):
+    if np is not None:
+        fbx_layer_index = elem_prop_array_as_np(fbx_layer_index, np.intp)
+        return np.arange(len(fbx_layer_index)), fbx_layer_index * stride
     return ((bi, fi * stride) for bi, fi in enumerate(fbx_layer_index))
 
 
 def blen_read_geom_array_gen_direct_looptovert(mesh, fbx_data, stride):
     fbx_data_len = len(fbx_data) // stride
+    if np is not None:
+        # mesh is a FBXGeomData here.
+        loops_idx, _polys_idx = blen_read_geom_polyloops_np(mesh)
+        loops_vidx = mesh.loops_vidx[loops_idx]
+        valid = loops_vidx < fbx_data_len
+        return loops_idx[valid], loops_vidx[valid].astype(np.intp) * stride
+    return blen_read_geom_array_gen_direct_looptovert_iter(mesh, fbx_data_len, stride)
+
+
+def blen_read_geom_array_gen_direct_looptovert_iter(mesh, fbx_data_len, stride):
     loops = mesh.loops
     for p in mesh.polygons:
         for lidx in p.loop_indices:
@@ -782,6 +1101,17 @@ def blen_read_geom_array_gen_direct_looptovert(mesh, fbx_data, stride):
                 yield lidx, vidx * stride
 
 
+def blen_read_geom_polyloops_np(geom):
+    """Return indices of all loops used by geom's polygons, and the matching polygon indices, as NumPy arrays."""
+    poly_loop_starts = geom.polys_loop_start
+    poly_loop_totals = geom.polys_loop_total
+    polys_idx = np.repeat(np.arange(len(poly_loop_starts)), poly_loop_totals)
+    # Offset between the position of each loop in polys_idx and its actual index.
+    offsets = np.cumsum(poly_loop_totals) - poly_loop_totals - poly_loop_starts
+    loops_idx = np.arange(len(polys_idx)) - np.repeat(offsets, poly_loop_totals)
+    return loops_idx, polys_idx
+
+
 # generic error printers.
 def blen_read_geom_array_error_mapping(descr, fbx_layer_mapping):
     print("warning layer %r mapping type unsupported: %r" % (descr, fbx_layer_mapping))
@@ -801,15 +1131,15 @@ def blen_read_geom_array_mapped_vert(
     if fbx_layer_mapping == b'ByVertice':
         if fbx_layer_ref == b'Direct':
             assert(fbx_layer_index is None)
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     elif fbx_layer_mapping == b'AllSame':
         if fbx_layer_ref == b'IndexToDirect':
             assert(fbx_layer_index is None)
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_allsame(len(blen_data)),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_allsame(len(blen_data)),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     else:
@@ -827,15 +1157,15 @@ def blen_read_geom_array_mapped_edge(
         ):
     if fbx_layer_mapping == b'ByEdge':
         if fbx_layer_ref == b'Direct':
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     elif fbx_layer_mapping == b'AllSame':
         if fbx_layer_ref == b'IndexToDirect':
             assert(fbx_layer_index is None)
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_allsame(len(blen_data)),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_allsame(len(blen_data)),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     else:
@@ -857,22 +1187,22 @@ def blen_read_geom_array_mapped_polygon(
             #     We fallback to 'Direct' mapping in this case.
             #~ assert(fbx_layer_index is not None)
             if fbx_layer_index is None:
-                blen_read_geom_array_setattr(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
-                                             blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+                blen_read_geom_array_set(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
+                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             else:
-                blen_read_geom_array_setattr(blen_read_geom_array_gen_indextodirect(fbx_layer_index, stride),
-                                             blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+                blen_read_geom_array_set(blen_read_geom_array_gen_indextodirect(fbx_layer_index, stride),
+                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         elif fbx_layer_ref == b'Direct':
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     elif fbx_layer_mapping == b'AllSame':
         if fbx_layer_ref == b'IndexToDirect':
             assert(fbx_layer_index is None)
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_allsame(len(blen_data)),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_allsame(len(blen_data)),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     else:
@@ -894,29 +1224,29 @@ def blen_read_geom_array_mapped_polyloop(
             #     We fallback to 'Direct' mapping in this case.
             #~ assert(fbx_layer_index is not None)
             if fbx_layer_index is None:
-                blen_read_geom_array_setattr(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
-                                             blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+                blen_read_geom_array_set(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
+                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             else:
-                blen_read_geom_array_setattr(blen_read_geom_array_gen_indextodirect(fbx_layer_index, stride),
-                                             blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+                blen_read_geom_array_set(blen_read_geom_array_gen_indextodirect(fbx_layer_index, stride),
+                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         elif fbx_layer_ref == b'Direct':
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_direct(fbx_layer_data, stride),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     elif fbx_layer_mapping == b'ByVertice':
         if fbx_layer_ref == b'Direct':
             assert(fbx_layer_index is None)
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_direct_looptovert(mesh, fbx_layer_data, stride),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_direct_looptovert(mesh, fbx_layer_data, stride),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     elif fbx_layer_mapping == b'AllSame':
         if fbx_layer_ref == b'IndexToDirect':
             assert(fbx_layer_index is None)
-            blen_read_geom_array_setattr(blen_read_geom_array_gen_allsame(len(blen_data)),
-                                         blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
+            blen_read_geom_array_set(blen_read_geom_array_gen_allsame(len(blen_data)),
+                                     blen_data, blen_attr, fbx_layer_data, stride, item_size, descr, xform)
             return True
         blen_read_geom_array_error_ref(descr, fbx_layer_ref)
     else:
@@ -925,6 +1255,23 @@ def blen_read_geom_array_mapped_polyloop(
     return False
 
 
+def blen_read_geom_layer_data(mesh, layer_type, layer_name, blen_attr):
+    """
+    Return the data to read given layer into, mesh being either a blender mesh or a FBXGeomData
+    (in which case a new FBXGeomLayer is returned, see blen_read_geom_decode).
+    """
+    if isinstance(mesh, FBXGeomData):
+        return mesh.layer_new(layer_type, layer_name, blen_attr)
+    if layer_type == 'UV':
+        mesh.uv_textures.new(name=layer_name)
+        return mesh.uv_layers[-1].data
+    elif layer_type == 'COLOR':
+        return mesh.vertex_colors.new(name=layer_name).data
+    elif layer_type == 'EDGE':
+        return mesh.edges
+    return mesh.polygons
+
+
 def blen_read_geom_layer_material(fbx_obj, mesh):
     fbx_layer = elem_find_first(fbx_obj, b'LayerElementMaterial')
 
@@ -939,7 +1286,7 @@ def blen_read_geom_layer_material(fbx_obj, mesh):
     layer_id = b'Materials'
     fbx_layer_data = elem_prop_first(elem_find_first(fbx_layer, layer_id))
 
-    blen_data = mesh.polygons
+    blen_data = blen_read_geom_layer_data(mesh, 'POLYGON', None, "material_index")
     blen_read_geom_array_mapped_polygon(
         mesh, blen_data, "material_index",
         fbx_layer_data, None,
@@ -960,9 +1307,7 @@ def blen_read_geom_layer_uv(fbx_obj, mesh):
             fbx_layer_data = elem_prop_first(elem_find_first(fbx_layer, b'UV'))
             fbx_layer_index = elem_prop_first(elem_find_first(fbx_layer, b'UVIndex'))
 
-            uv_tex = mesh.uv_textures.new(name=fbx_layer_name)
-            uv_lay = mesh.uv_layers[-1]
-            blen_data = uv_lay.data
+            blen_data = blen_read_geom_layer_data(mesh, 'UV', fbx_layer_name, "uv")
 
             # some valid files omit this data
             if fbx_layer_data is None:
@@ -990,8 +1335,7 @@ def blen_read_geom_layer_color(fbx_obj, mesh):
             fbx_layer_data = elem_prop_first(elem_find_first(fbx_layer, b'Colors'))
             fbx_layer_index = elem_prop_first(elem_find_first(fbx_layer, b'ColorIndex'))
 
-            color_lay = mesh.vertex_colors.new(name=fbx_layer_name)
-            blen_data = color_lay.data
+            blen_data = blen_read_geom_layer_data(mesh, 'COLOR', fbx_layer_name, "color")
 
             # some valid files omit this data
             if fbx_layer_data is None:
@@ -1027,25 +1371,25 @@ def blen_read_geom_layer_smooth(fbx_obj, mesh):
         return False
 
     if fbx_layer_mapping == b'ByEdge':
+        blen_data = blen_read_geom_layer_data(mesh, 'EDGE', None, "use_edge_sharp")
         # some models have bad edge data, we cant use this info...
-        if not mesh.edges:
+        if not len(blen_data):
             print("warning skipping sharp edges data, no valid edges...")
             return False
 
-        blen_data = mesh.edges
         blen_read_geom_array_mapped_edge(
             mesh, blen_data, "use_edge_sharp",
             fbx_layer_data, None,
             fbx_layer_mapping, fbx_layer_ref,
             1, 1, layer_id,
-            xform=lambda s: not s,
+            xform=lambda s: (s == 0),
             )
         # We only set sharp edges here, not face smoothing itself...
         mesh.use_auto_smooth = True
         mesh.show_edge_sharp = True
         return False
     elif fbx_layer_mapping == b'ByPolygon':
-        blen_data = mesh.polygons
+        blen_data = blen_read_geom_layer_data(mesh, 'POLYGON', None, "use_smooth")
         return blen_read_geom_array_mapped_polygon(
             mesh, blen_data, "use_smooth",
             fbx_layer_data, None,
@@ -1073,6 +1417,18 @@ def blen_read_geom_layer_normal(fbx_obj, mesh, xform=None):
     fbx_layer_data = elem_prop_first(elem_find_first(fbx_layer, layer_id))
     fbx_layer_index = elem_prop_first(elem_find_first(fbx_layer, b'NormalsIndex'))
 
+    if isinstance(mesh, FBXGeomData):
+        # try loops, then vertices.
+        for layer_type, func in (('LOOP', blen_read_geom_array_mapped_polyloop),
+                                 ('POLYGON', blen_read_geom_array_mapped_polygon),
+                                 ('VERTEX', blen_read_geom_array_mapped_vert)):
+            layer = FBXGeomLayer(mesh.layer_len(layer_type))
+            if func(mesh, layer, "normal",
+                    fbx_layer_data, fbx_layer_index, fbx_layer_mapping, fbx_layer_ref, 3, 3, layer_id, xform):
+                mesh.loops_normal_set(layer_type, layer)
+                return True
+        return False
+
     # try loops, then vertices.
     tries = ((mesh.loops, False, blen_read_geom_array_mapped_polyloop),
              (mesh.polygons, True, blen_read_geom_array_mapped_polygon),
@@ -1093,19 +1449,149 @@ def blen_read_geom_layer_normal(fbx_obj, mesh, xform=None):
     return False
 
 
-def blen_read_geom(fbx_tmpl, fbx_obj, settings):
-    from itertools import chain
-    import array
-
+def blen_read_geom_matrices(settings):
+    """Return the (co, no) matrices to apply to imported geometry, (None, None) if not baking space transform."""
+    if not settings.bake_space_transform:
+        return None, None
     # Vertices are in object space, but we are post-multiplying all transforms with the inverse of the
     # global matrix, so we need to apply the global matrix to the vertices to get the correct result.
-    geom_mat_co = settings.global_matrix if settings.bake_space_transform else None
+    geom_mat_co = settings.global_matrix
     # We need to apply the inverse transpose of the global matrix when transforming normals.
-    geom_mat_no = Matrix(settings.global_matrix_inv_transposed) if settings.bake_space_transform else None
-    if geom_mat_no is not None:
-        # Remove translation & scaling!
-        geom_mat_no.translation = Vector()
-        geom_mat_no.normalize()
+    geom_mat_no = Matrix(settings.global_matrix_inv_transposed)
+    # Remove translation & scaling!
+    geom_mat_no.translation = Vector()
+    geom_mat_no.normalize()
+    return geom_mat_co, geom_mat_no
+
+
+def blen_read_geom_matrices_np(geom_mat_co, geom_mat_no):
+    """NumPy versions of blen_read_geom_matrices() ones, as expected by blen_read_geom_decode()."""
+    return tuple(None if m is None else np.array(m, dtype=np.float64) for m in (geom_mat_co, geom_mat_no))
+
+
+def blen_read_geom_decode(fbx_obj, geom_mat_co=None, geom_mat_no=None, use_custom_normals=True):
+    """
+    Decode all geometry data of given FBX element into a FBXGeomData (requires NumPy).
+
+    This is the bpy-free part of blen_read_geom (geom_mat_co and geom_mat_no being NumPy matrices,
+    see blen_read_geom_matrices_np), so it may run in worker threads.
+    """
+    # TODO, use 'fbx_tmpl'
+    geom = FBXGeomData(elem_name_ensure_class(fbx_obj, b'Geometry'))
+
+    fbx_verts = elem_prop_first(elem_find_first(fbx_obj, b'Vertices'))
+    fbx_polys = elem_prop_first(elem_find_first(fbx_obj, b'PolygonVertexIndex'))
+    fbx_edges = elem_prop_first(elem_find_first(fbx_obj, b'Edges'))
+
+    if fbx_verts is not None:
+        verts = elem_prop_array_as_np(fbx_verts, np.float64).reshape(-1, 3)
+        if geom_mat_co is not None:
+            verts = np.dot(verts, geom_mat_co[:3, :3].T) + geom_mat_co[:3, 3]
+        # Matches the internal float type of 'co', so that foreach_set can use the buffer directly.
+        geom.verts_co = verts.astype(np.float32).ravel()
+
+    if fbx_polys:
+        polys = elem_prop_array_as_np(fbx_polys, np.int32)
+        polys_end = polys < 0
+        # Last index of each polygon is stored as its bitwise complement.
+        geom.loops_vidx = np.where(polys_end, ~polys, polys)
+        poly_loop_ends = np.flatnonzero(polys_end)
+        poly_loop_starts = np.empty(len(poly_loop_ends) + 1, dtype=np.int32)
+        poly_loop_starts[0] = 0
+        poly_loop_starts[1:] = poly_loop_ends + 1
+        geom.polys_loop_start = poly_loop_starts[:-1]
+        geom.polys_loop_total = (poly_loop_ends + 1 - poly_loop_starts[:-1]).astype(np.int32)
+
+        blen_read_geom_layer_material(fbx_obj, geom)
+        blen_read_geom_layer_uv(fbx_obj, geom)
+        blen_read_geom_layer_color(fbx_obj, geom)
+
+    if fbx_edges:
+        # edges in fact index the polygons (NOT the vertices)
+        edges = elem_prop_array_as_np(fbx_edges, np.intp)
+        # For each loop, the index of the first loop of its polygon.
+        loops_poly_start = poly_loop_starts[np.cumsum(polys_end) - polys_end]
+        edges_end = polys_end[edges]
+        # Last index of polygon wraps back to the start.
+        edges_next = np.where(edges_end, loops_poly_start[edges], np.minimum(edges + 1, len(polys) - 1))
+        if not np.all(edges_end | (edges + 1 < len(polys))):
+            raise IndexError("Edge references past the last polygon vertex index")
+
+        edges_conv = np.empty((len(edges), 2), dtype=np.int32)
+        edges_conv[:, 0] = geom.loops_vidx[edges]
+        edges_conv[:, 1] = geom.loops_vidx[edges_next]
+        geom.edges_vidx = edges_conv.ravel()
+
+    # must be after edge, face loading.
+    geom.ok_smooth = blen_read_geom_layer_smooth(fbx_obj, geom)
+
+    if use_custom_normals:
+        if geom_mat_no is None:
+            blen_read_geom_layer_normal(fbx_obj, geom)
+        else:
+            geom_mat_no = geom_mat_no[:3, :3]
+
+            def nortrans(v):
+                return np.dot(v, geom_mat_no.T)
+            blen_read_geom_layer_normal(fbx_obj, geom, nortrans)
+
+    return geom
+
+
+def blen_read_geom_apply(geom, settings):
+    """Create a new blender mesh from given FBXGeomData, return it with its ok_smooth and ok_normals flags."""
+    mesh = bpy.data.meshes.new(name=geom.name)
+    mesh.vertices.add(len(geom.verts_co) // 3)
+    mesh.vertices.foreach_set("co", geom.verts_co)
+
+    if len(geom.loops_vidx):
+        mesh.loops.add(len(geom.loops_vidx))
+        mesh.loops.foreach_set("vertex_index", geom.loops_vidx)
+        mesh.polygons.add(len(geom.polys_loop_start))
+        mesh.polygons.foreach_set("loop_start", geom.polys_loop_start)
+        mesh.polygons.foreach_set("loop_total", geom.polys_loop_total)
+
+    if len(geom.edges_vidx):
+        mesh.edges.add(len(geom.edges_vidx) // 2)
+        mesh.edges.foreach_set("vertices", geom.edges_vidx)
+
+    for layer_type, layer_name, blen_attr, layer in geom.layers:
+        blen_data = blen_read_geom_layer_data(mesh, layer_type, layer_name, blen_attr)
+        if layer.indices is not None:
+            blen_read_geom_array_foreach_set(blen_data, blen_attr, layer.indices, layer.items)
+
+    if geom.use_auto_smooth:
+        mesh.use_auto_smooth = True
+    if geom.show_edge_sharp:
+        mesh.show_edge_sharp = True
+
+    ok_normals = False
+    if settings.use_custom_normals:
+        # Note: we store 'temp' normals in loops, since validate() may alter final mesh,
+        #       we can only set custom lnors *after* calling it.
+        mesh.create_normals_split()
+        if geom.loops_normal is not None:
+            blen_read_geom_array_foreach_set(mesh.loops, "normal", geom.loops_normal.indices, geom.loops_normal.items)
+            ok_normals = True
+
+    return mesh, geom.ok_smooth, ok_normals
+
+
+def blen_read_geom(fbx_tmpl, fbx_obj, settings, geom=None):
+    """
+    geom is an optional FBXGeomData for fbx_obj, as returned by blen_read_geom_decode() (e.g. from a worker thread).
+    """
+    from itertools import chain
+    import array
+
+    geom_mat_co, geom_mat_no = blen_read_geom_matrices(settings)
+
+    if np is not None:
+        if geom is None:
+            geom = blen_read_geom_decode(fbx_obj, *blen_read_geom_matrices_np(geom_mat_co, geom_mat_no),
+                                         use_custom_normals=settings.use_custom_normals)
+        mesh, ok_smooth, ok_normals = blen_read_geom_apply(geom, settings)
+        return blen_read_geom_finalize(fbx_obj, mesh, settings, ok_smooth, ok_normals)
 
     # TODO, use 'fbx_tmpl'
     elem_name_utf8 = elem_name_ensure_class(fbx_obj, b'Geometry')
@@ -1197,6 +1683,12 @@ def blen_read_geom(fbx_tmpl, fbx_obj, settings):
                 return geom_mat_no * Vector(v)
             ok_normals = blen_read_geom_layer_normal(fbx_obj, mesh, nortrans)
 
+    return blen_read_geom_finalize(fbx_obj, mesh, settings, ok_smooth, ok_normals)
+
+
+def blen_read_geom_finalize(fbx_obj, mesh, settings, ok_smooth, ok_normals):
+    import array
+
     mesh.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
 
     if ok_normals:
@@ -2192,6 +2684,54 @@ class FbxImportHelperNode:
             return None
 
 
+class FBXConnections:
+    """
+    Index of the connections of a FBX file, in both directions.
+
+    Links of each object are bucketed by connection type (b'OO', b'OP'...), id of the connected element (b'Model',
+    b'AnimationCurve'...) and connected property (OP links only), so that queries on any of those do not have to scan
+    all links of the object.
+    Queries return lists of (uuid, fbx_item, fbx_link) tuples in file order, fbx_item being the
+    [fbx_elem, blen_data] item of the connected object in fbx_table_nodes ((None, None) for the root or unknown ones).
+    """
+
+    __slots__ = ('forward', 'reverse')
+
+    def __init__(self, fbx_connections, fbx_table_nodes):
+        self.forward = {}
+        self.reverse = {}
+        nil_item = (None, None)
+        for fbx_link in fbx_connections.elems:
+            if fbx_link.props_type[1:3] != b'LL':
+                continue
+            c_type = fbx_link.props[0]
+            c_prop = fbx_link.props[3] if len(fbx_link.props) > 3 else None
+            c_src, c_dst = fbx_link.props[1:3]
+            src_item = fbx_table_nodes.get(c_src, nil_item)
+            dst_item = fbx_table_nodes.get(c_dst, nil_item)
+            self._add(self.forward, c_src, c_type, dst_item, c_prop, (c_dst, dst_item, fbx_link))
+            self._add(self.reverse, c_dst, c_type, src_item, c_prop, (c_src, src_item, fbx_link))
+
+    @staticmethod
+    def _add(links, fbx_uuid, c_type, fbx_item, c_prop, link):
+        fbx_id = None if fbx_item[0] is None else fbx_item[0].id
+        keys = {(fbx_uuid, None, None, None), (fbx_uuid, None, fbx_id, None),
+                (fbx_uuid, c_type, None, None), (fbx_uuid, c_type, fbx_id, None)}
+        if c_prop is not None:
+            keys.add((fbx_uuid, c_type, None, c_prop))
+            keys.add((fbx_uuid, c_type, fbx_id, c_prop))
+        for key in keys:
+            links.setdefault(key, []).append(link)
+
+    def get_forward(self, fbx_uuid, c_type=None, fbx_id=None, c_prop=None):
+        """Links from given object to the ones it is connected to (its parents)."""
+        return self.forward.get((fbx_uuid, c_type, fbx_id, c_prop), ())
+
+    def get_reverse(self, fbx_uuid, c_type=None, fbx_id=None, c_prop=None):
+        """Links to given object from the ones connected to it (its children)."""
+        return self.reverse.get((fbx_uuid, c_type, fbx_id, c_prop), ())
+
+
 def is_ascii(filepath, size):
     with open(filepath, 'r', encoding="utf-8") as f:
         try:
@@ -2203,30 +2743,75 @@ def is_ascii(filepath, size):
     return False
 
 
-def load(operator, context, filepath="",
-         use_manual_orientation=False,
-         axis_forward='-Z',
-         axis_up='Y',
-         global_scale=1.0,
-         bake_space_transform=False,
-         use_custom_normals=True,
-         use_cycles=True,
-         use_image_search=False,
-         use_alpha_decals=False,
-         decal_offset=0.0,
-         use_anim=True,
-         anim_offset=1.0,
-         use_custom_props=True,
-         use_custom_props_enum_as_string=True,
-         ignore_leaf_bones=False,
-         force_connect_children=False,
-         automatic_bone_orientation=False,
-         primary_bone_axis='Y',
-         secondary_bone_axis='X',
-         use_prepost_rot=True):
+# Top-level sections of FBX files the importer reads.
+_LOAD_SECTIONS = {b'GlobalSettings', b'Definitions', b'Objects', b'Connections'}
+
+
+def load_decode(filepath, use_custom_normals=True, use_geom_decode=True):
+    """
+    Parse given FBX file and decode its meshes geometry (when NumPy is available and use_geom_decode is True).
+
+    This does not use bpy at all, so that it may run in worker processes (see load_multi()).
+    Returns an (elem_root, version, geoms) tuple as expected by load()'s fbx_data, geoms being a dict
+    {geometry uuid: FBXGeomData}. Note that geometries are decoded without baking space transform.
+    """
+    if is_ascii(filepath, 24):
+        raise Exception("ASCII FBX files are not supported %r" % filepath)
+
+    elem_root, version = parse_fbx.parse(filepath, use_threads=True, include=_LOAD_SECTIONS)
+
+    geoms = {}
+    if use_geom_decode and np is not None and version >= 7100:
+        fbx_nodes = elem_find_first(elem_root, b'Objects')
+        if fbx_nodes is not None:
+            for fbx_obj in fbx_nodes.elems:
+                if fbx_obj.id == b'Geometry' and fbx_obj.props[-1] == b'Mesh':
+                    geoms[elem_uuid(fbx_obj)] = blen_read_geom_decode(fbx_obj, use_custom_normals=use_custom_normals)
+    return elem_root, version, geoms
+
+
+def load(operator, context, filepath="", **kwargs):
+    """
+    Import given FBX file into current scene, see _load() for kwargs.
+    """
+    try:
+        return _load(operator, context, filepath, **kwargs)
+    finally:
+        # Do not keep imported FBX data alive, even when import failed or was cancelled.
+        fbx_elem_props_index.clear()
+
+
+def _load(operator, context, filepath="",
+          use_manual_orientation=False,
+          axis_forward='-Z',
+          axis_up='Y',
+          global_scale=1.0,
+          bake_space_transform=False,
+          use_custom_normals=True,
+          use_cycles=True,
+          use_image_search=False,
+          use_alpha_decals=False,
+          decal_offset=0.0,
+          use_anim=True,
+          anim_offset=1.0,
+          use_custom_props=True,
+          use_custom_props_enum_as_string=True,
+          ignore_leaf_bones=False,
+          force_connect_children=False,
+          automatic_bone_orientation=False,
+          primary_bone_axis='Y',
+          secondary_bone_axis='X',
+          use_prepost_rot=True,
+          fbx_data=None):
+    """
+    fbx_data is an optional (elem_root, version, geoms) tuple as returned by load_decode(),
+    to import instead of reading filepath again.
+    """
 
     global fbx_elem_nil
     fbx_elem_nil = FBXElem('', (), (), ())
+    global fbx_elem_props_index
+    fbx_elem_props_index = {}
 
     import os
     import time
@@ -2243,19 +2828,23 @@ def load(operator, context, filepath="",
     perfmon.step("FBX Import: start importing %s" % filepath)
     perfmon.level_up()
 
-    # detect ascii files
-    if is_ascii(filepath, 24):
-        operator.report({'ERROR'}, "ASCII FBX files are not supported %r" % filepath)
-        return {'CANCELLED'}
+    if fbx_data is not None:
+        elem_root, version, fbx_geoms = fbx_data
+    else:
+        # detect ascii files
+        if is_ascii(filepath, 24):
+            operator.report({'ERROR'}, "ASCII FBX files are not supported %r" % filepath)
+            return {'CANCELLED'}
 
-    try:
-        elem_root, version = parse_fbx.parse(filepath)
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
+        try:
+            elem_root, version = parse_fbx.parse(filepath, use_threads=True, include=_LOAD_SECTIONS)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
 
-        operator.report({'ERROR'}, "Couldn't open file %r (%s)" % (filepath, e))
-        return {'CANCELLED'}
+            operator.report({'ERROR'}, "Couldn't open file %r (%s)" % (filepath, e))
+            return {'CANCELLED'}
+        fbx_geoms = {}
 
     if version < 7100:
         operator.report({'ERROR'}, "Version %r unsupported, must be %r or later" % (version, 7100))
@@ -2279,6 +2868,10 @@ def load(operator, context, filepath="",
 
     # Tables: (FBX_byte_id -> [FBX_data, None or Blender_datablock])
     fbx_table_nodes = {}
+    # Same items, classified once for all by element id, and by (element id, subclass) (i.e. 3rd property, e.g.
+    # (b'Geometry', b'Shape')), as lists of (FBX_byte_id, [FBX_data, None or Blender_datablock]) in file order.
+    fbx_table_nodes_by_id = {}
+    fbx_table_nodes_by_class = {}
 
     if use_alpha_decals:
         material_decals = set()
@@ -2404,7 +2997,9 @@ def load(operator, context, filepath="",
             # TODO, investigate what other items after first 3 may be
             assert(fbx_obj.props_type[:3] == b'LSS')
             fbx_uuid = elem_uuid(fbx_obj)
-            fbx_table_nodes[fbx_uuid] = [fbx_obj, None]
+            fbx_table_nodes[fbx_uuid] = fbx_item = [fbx_obj, None]
+            fbx_table_nodes_by_id.setdefault(fbx_obj.id, []).append((fbx_uuid, fbx_item))
+            fbx_table_nodes_by_class.setdefault((fbx_obj.id, fbx_obj.props[2]), []).append((fbx_uuid, fbx_item))
     _(); del _
 
     # ----
@@ -2414,17 +3009,7 @@ def load(operator, context, filepath="",
 
     perfmon.step("FBX import: Connections...")
 
-    fbx_connection_map = {}
-    fbx_connection_map_reverse = {}
-
-    def _():
-        for fbx_link in fbx_connections.elems:
-            c_type = fbx_link.props[0]
-            if fbx_link.props_type[1:3] == b'LL':
-                c_src, c_dst = fbx_link.props[1:3]
-                fbx_connection_map.setdefault(c_src, []).append((c_dst, fbx_link))
-                fbx_connection_map_reverse.setdefault(c_dst, []).append((c_src, fbx_link))
-    _(); del _
+    fbx_connection_graph = FBXConnections(fbx_connections, fbx_table_nodes)
 
     perfmon.step("FBX import: Meshes...")
 
@@ -2433,13 +3018,54 @@ def load(operator, context, filepath="",
     def _():
         fbx_tmpl = fbx_template_get((b'Geometry', b'KFbxMesh'))
 
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        fbx_items = []
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Geometry', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Geometry':
-                continue
             if fbx_obj.props[-1] == b'Mesh':
                 assert(blen_data is None)
-                fbx_item[1] = blen_read_geom(fbx_tmpl, fbx_obj, settings)
+                fbx_items.append(fbx_item)
+
+        if np is None:
+            for fbx_item in fbx_items:
+                fbx_item[1] = blen_read_geom(fbx_tmpl, fbx_item[0], settings)
+            return
+
+        # Decode geometries in worker threads (NumPy releases the GIL for most of the heavy work),
+        # while main thread creates blender meshes from already decoded ones.
+        import os
+        from collections import deque
+        from concurrent.futures import ThreadPoolExecutor
+
+        geom_mats = blen_read_geom_matrices_np(*blen_read_geom_matrices(settings))
+
+        def geom_decode(fbx_obj):
+            # Geometries may already have been decoded by load_decode(), which does not bake space transform.
+            geom = None if settings.bake_space_transform else fbx_geoms.get(elem_uuid(fbx_obj))
+            if geom is None:
+                geom = blen_read_geom_decode(fbx_obj, *geom_mats, use_custom_normals=settings.use_custom_normals)
+            return geom
+
+        workers = os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Limit the amount of decoded geometries waiting for the main thread, since each of them
+            # keeps all its buffers alive.
+            pending = deque()
+            fbx_items_iter = iter(fbx_items)
+            try:
+                for fbx_item in fbx_items_iter:
+                    pending.append((fbx_item, executor.submit(geom_decode, fbx_item[0])))
+                    if len(pending) >= workers * 2:
+                        break
+                while pending:
+                    fbx_item, future = pending.popleft()
+                    for fbx_item_next in fbx_items_iter:
+                        pending.append((fbx_item_next, executor.submit(geom_decode, fbx_item_next[0])))
+                        break
+                    fbx_item[1] = blen_read_geom(fbx_tmpl, fbx_item[0], settings, future.result())
+            except BaseException:
+                for _fbx_item, future in pending:
+                    future.cancel()
+                raise
     _(); del _
 
     perfmon.step("FBX import: Materials & Textures...")
@@ -2450,10 +3076,8 @@ def load(operator, context, filepath="",
         fbx_tmpl = fbx_template_get((b'Material', b'KFbxSurfacePhong'))
         # b'KFbxSurfaceLambert'
 
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Material', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Material':
-                continue
             assert(blen_data is None)
             fbx_item[1] = blen_read_material(fbx_tmpl, fbx_obj, settings)
     _(); del _
@@ -2467,15 +3091,11 @@ def load(operator, context, filepath="",
         # Important to run all 'Video' ones first, embedded images are stored in those nodes.
         # XXX Note we simplify things here, assuming both matching Video and Texture will use same file path,
         #     this may be a bit weak, if issue arise we'll fallback to plain connection stuff...
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Video', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Video':
-                continue
             fbx_item[1] = blen_read_texture_image(fbx_tmpl_img, fbx_obj, basedir, settings)
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Texture', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Texture':
-                continue
             fbx_item[1] = blen_read_texture_image(fbx_tmpl_tex, fbx_obj, basedir, settings)
     _(); del _
 
@@ -2486,10 +3106,8 @@ def load(operator, context, filepath="",
     def _():
         fbx_tmpl = fbx_template_get((b'NodeAttribute', b'KFbxCamera'))
 
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'NodeAttribute', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'NodeAttribute':
-                continue
             if fbx_obj.props[-1] == b'Camera':
                 assert(blen_data is None)
                 fbx_item[1] = blen_read_camera(fbx_tmpl, fbx_obj, global_scale)
@@ -2500,10 +3118,8 @@ def load(operator, context, filepath="",
     def _():
         fbx_tmpl = fbx_template_get((b'NodeAttribute', b'KFbxLight'))
 
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'NodeAttribute', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'NodeAttribute':
-                continue
             if fbx_obj.props[-1] == b'Light':
                 assert(blen_data is None)
                 fbx_item[1] = blen_read_light(fbx_tmpl, fbx_obj, global_scale)
@@ -2511,18 +3127,17 @@ def load(operator, context, filepath="",
 
     # ----
     # Connections
-    def connection_filter_ex(fbx_uuid, fbx_id, dct):
+    def connection_filter_ex(fbx_uuid, fbx_id, links):
         return [(c_found[0], c_found[1], c_type)
-                for (c_uuid, c_type) in dct.get(fbx_uuid, ())
+                for (c_uuid, c_found, c_type) in links(fbx_uuid, fbx_id=fbx_id)
                 # 0 is used for the root node, which isnt in fbx_table_nodes
-                for c_found in (() if c_uuid is 0 else (fbx_table_nodes.get(c_uuid, (None, None)),))
-                if (fbx_id is None) or (c_found[0] and c_found[0].id == fbx_id)]
+                if c_uuid != 0]
 
     def connection_filter_forward(fbx_uuid, fbx_id):
-        return connection_filter_ex(fbx_uuid, fbx_id, fbx_connection_map)
+        return connection_filter_ex(fbx_uuid, fbx_id, fbx_connection_graph.get_forward)
 
     def connection_filter_reverse(fbx_uuid, fbx_id):
-        return connection_filter_ex(fbx_uuid, fbx_id, fbx_connection_map_reverse)
+        return connection_filter_ex(fbx_uuid, fbx_id, fbx_connection_graph.get_reverse)
 
     perfmon.step("FBX import: Objects & Armatures...")
 
@@ -2542,10 +3157,8 @@ def load(operator, context, filepath="",
 
         # add fbx nodes
         fbx_tmpl = fbx_template_get((b'Model', b'KFbxNode'))
-        for a_uuid, a_item in fbx_table_nodes.items():
+        for a_uuid, a_item in fbx_table_nodes_by_id.get(b'Model', ()):
             fbx_obj, bl_data = a_item
-            if fbx_obj is None or fbx_obj.id != b'Model':
-                continue
 
             fbx_props = (elem_find_first(fbx_obj, b'Properties70'),
                          elem_find_first(fbx_tmpl, b'Properties70', fbx_elem_nil))
@@ -2598,14 +3211,8 @@ def load(operator, context, filepath="",
         # Maybe some conversion can be applied to put them all into the same frame of reference?
 
         # get the bind pose from pose elements
-        for a_uuid, a_item in fbx_table_nodes.items():
+        for a_uuid, a_item in fbx_table_nodes_by_class.get((b'Pose', b'BindPose'), ()):
             fbx_obj, bl_data = a_item
-            if fbx_obj is None:
-                continue
-            if fbx_obj.id != b'Pose':
-                continue
-            if fbx_obj.props[2] != b'BindPose':
-                continue
             for fbx_pose_node in fbx_obj.elems:
                 if fbx_pose_node.id != b'PoseNode':
                     continue
@@ -2623,11 +3230,9 @@ def load(operator, context, filepath="",
         for helper_uuid, helper_node in fbx_helper_nodes.items():
             if not helper_node.is_bone:
                 continue
-            for cluster_uuid, cluster_link in fbx_connection_map.get(helper_uuid, ()):
-                if cluster_link.props[0] != b'OO':
-                    continue
-                fbx_cluster, _ = fbx_table_nodes.get(cluster_uuid, (None, None))
-                if fbx_cluster is None or fbx_cluster.id != b'Deformer' or fbx_cluster.props[2] != b'Cluster':
+            for cluster_uuid, (fbx_cluster, _), cluster_link in fbx_connection_graph.get_forward(helper_uuid, b'OO',
+                                                                                                  b'Deformer'):
+                if fbx_cluster.props[2] != b'Cluster':
                     continue
 
                 # Get the bind pose from the cluster:
@@ -2649,21 +3254,15 @@ def load(operator, context, filepath="",
 
                 # Get the meshes driven by this cluster: (Shouldn't that be only one?)
                 meshes = set()
-                for skin_uuid, skin_link in fbx_connection_map.get(cluster_uuid):
-                    if skin_link.props[0] != b'OO':
-                        continue
-                    fbx_skin, _ = fbx_table_nodes.get(skin_uuid, (None, None))
-                    if fbx_skin is None or fbx_skin.id != b'Deformer' or fbx_skin.props[2] != b'Skin':
+                for skin_uuid, (fbx_skin, _), skin_link in fbx_connection_graph.get_forward(cluster_uuid, b'OO',
+                                                                                            b'Deformer'):
+                    if fbx_skin.props[2] != b'Skin':
                         continue
-                    for mesh_uuid, mesh_link in fbx_connection_map.get(skin_uuid):
-                        if mesh_link.props[0] != b'OO':
+                    for mesh_uuid, (fbx_mesh, _), mesh_link in fbx_connection_graph.get_forward(skin_uuid, b'OO',
+                                                                                                b'Geometry'):
+                        if fbx_mesh.props[2] != b'Mesh':
                             continue
-                        fbx_mesh, _ = fbx_table_nodes.get(mesh_uuid, (None, None))
-                        if fbx_mesh is None or fbx_mesh.id != b'Geometry' or fbx_mesh.props[2] != b'Mesh':
-                            continue
-                        for object_uuid, object_link in fbx_connection_map.get(mesh_uuid):
-                            if object_link.props[0] != b'OO':
-                                continue
+                        for object_uuid, _, object_link in fbx_connection_graph.get_forward(mesh_uuid, b'OO'):
                             mesh_node = fbx_helper_nodes[object_uuid]
                             if mesh_node:
                                 # ----
@@ -2703,39 +3302,29 @@ def load(operator, context, filepath="",
     def _():
         fbx_tmpl = fbx_template_get((b'Geometry', b'KFbxShape'))
 
-        for s_uuid, s_item in fbx_table_nodes.items():
-            fbx_sdata, bl_sdata = s_item = fbx_table_nodes.get(s_uuid, (None, None))
-            if fbx_sdata is None or fbx_sdata.id != b'Geometry' or fbx_sdata.props[2] != b'Shape':
-                continue
+        for s_uuid, s_item in fbx_table_nodes_by_class.get((b'Geometry', b'Shape'), ()):
+            fbx_sdata, bl_sdata = s_item
 
             # shape -> blendshapechannel -> blendshape -> mesh.
-            for bc_uuid, bc_ctype in fbx_connection_map.get(s_uuid, ()):
-                if bc_ctype.props[0] != b'OO':
-                    continue
-                fbx_bcdata, _bl_bcdata = fbx_table_nodes.get(bc_uuid, (None, None))
-                if fbx_bcdata is None or fbx_bcdata.id != b'Deformer' or fbx_bcdata.props[2] != b'BlendShapeChannel':
+            for bc_uuid, (fbx_bcdata, _bl_bcdata), bc_ctype in fbx_connection_graph.get_forward(s_uuid, b'OO',
+                                                                                                 b'Deformer'):
+                if fbx_bcdata.props[2] != b'BlendShapeChannel':
                     continue
                 meshes = []
                 objects = []
-                for bs_uuid, bs_ctype in fbx_connection_map.get(bc_uuid, ()):
-                    if bs_ctype.props[0] != b'OO':
-                        continue
-                    fbx_bsdata, _bl_bsdata = fbx_table_nodes.get(bs_uuid, (None, None))
-                    if fbx_bsdata is None or fbx_bsdata.id != b'Deformer' or fbx_bsdata.props[2] != b'BlendShape':
+                for bs_uuid, (fbx_bsdata, _bl_bsdata), bs_ctype in fbx_connection_graph.get_forward(bc_uuid, b'OO',
+                                                                                                     b'Deformer'):
+                    if fbx_bsdata.props[2] != b'BlendShape':
                         continue
-                    for m_uuid, m_ctype in fbx_connection_map.get(bs_uuid, ()):
-                        if m_ctype.props[0] != b'OO':
-                            continue
-                        fbx_mdata, bl_mdata = fbx_table_nodes.get(m_uuid, (None, None))
-                        if fbx_mdata is None or fbx_mdata.id != b'Geometry' or fbx_mdata.props[2] != b'Mesh':
+                    for m_uuid, (fbx_mdata, bl_mdata), m_ctype in fbx_connection_graph.get_forward(bs_uuid, b'OO',
+                                                                                                    b'Geometry'):
+                        if fbx_mdata.props[2] != b'Mesh':
                             continue
                         # Blenmeshes are assumed already created at that time!
                         assert(isinstance(bl_mdata, bpy.types.Mesh))
                         # And we have to find all objects using this mesh!
                         objects = []
-                        for o_uuid, o_ctype in fbx_connection_map.get(m_uuid, ()):
-                            if o_ctype.props[0] != b'OO':
-                                continue
+                        for o_uuid, _o_item, o_ctype in fbx_connection_graph.get_forward(m_uuid, b'OO'):
                             node = fbx_helper_nodes[o_uuid]
                             if node:
                                 objects.append(node)
@@ -2757,42 +3346,31 @@ def load(operator, context, filepath="",
             stacks = {}
 
             # AnimationStacks.
-            for as_uuid, fbx_asitem in fbx_table_nodes.items():
+            for as_uuid, fbx_asitem in fbx_table_nodes_by_class.get((b'AnimationStack', b''), ()):
                 fbx_asdata, _blen_data = fbx_asitem
-                if fbx_asdata.id != b'AnimationStack' or fbx_asdata.props[2] != b'':
-                    continue
                 stacks[as_uuid] = (fbx_asitem, {})
 
             # AnimationLayers
             # (mixing is completely ignored for now, each layer results in an independent set of actions).
             def get_astacks_from_alayer(al_uuid):
-                for as_uuid, as_ctype in fbx_connection_map.get(al_uuid, ()):
-                    if as_ctype.props[0] != b'OO':
-                        continue
-                    fbx_asdata, _bl_asdata = fbx_table_nodes.get(as_uuid, (None, None))
-                    if (fbx_asdata is None or fbx_asdata.id != b'AnimationStack' or
-                        fbx_asdata.props[2] != b'' or as_uuid not in stacks):
+                for as_uuid, (fbx_asdata, _bl_asdata), as_ctype in fbx_connection_graph.get_forward(al_uuid, b'OO',
+                                                                                                     b'AnimationStack'):
+                    if fbx_asdata.props[2] != b'' or as_uuid not in stacks:
                         continue
                     yield as_uuid
-            for al_uuid, fbx_alitem in fbx_table_nodes.items():
+            for al_uuid, fbx_alitem in fbx_table_nodes_by_class.get((b'AnimationLayer', b''), ()):
                 fbx_aldata, _blen_data = fbx_alitem
-                if fbx_aldata.id != b'AnimationLayer' or fbx_aldata.props[2] != b'':
-                    continue
                 for as_uuid in get_astacks_from_alayer(al_uuid):
                     _fbx_asitem, alayers = stacks[as_uuid]
                     alayers[al_uuid] = (fbx_alitem, {})
 
             # AnimationCurveNodes (also the ones linked to actual animated data!).
             curvenodes = {}
-            for acn_uuid, fbx_acnitem in fbx_table_nodes.items():
+            for acn_uuid, fbx_acnitem in fbx_table_nodes_by_class.get((b'AnimationCurveNode', b''), ()):
                 fbx_acndata, _blen_data = fbx_acnitem
-                if fbx_acndata.id != b'AnimationCurveNode' or fbx_acndata.props[2] != b'':
-                    continue
                 cnode = curvenodes[acn_uuid] = {}
                 items = []
-                for n_uuid, n_ctype in fbx_connection_map.get(acn_uuid, ()):
-                    if n_ctype.props[0] != b'OP':
-                        continue
+                for n_uuid, _n_item, n_ctype in fbx_connection_graph.get_forward(acn_uuid, b'OP'):
                     lnk_prop = n_ctype.props[3]
                     if lnk_prop in {b'Lcl Translation', b'Lcl Rotation', b'Lcl Scaling'}:
                         # n_uuid can (????) be linked to root '0' node, instead of a mere object node... See T41712.
@@ -2805,11 +3383,10 @@ def load(operator, context, filepath="",
                         if keyblocks is None:
                             continue
                         items += [(kb, lnk_prop) for kb in keyblocks]
-                for al_uuid, al_ctype in fbx_connection_map.get(acn_uuid, ()):
-                    if al_ctype.props[0] != b'OO':
-                        continue
-                    fbx_aldata, _blen_aldata = fbx_alitem = fbx_table_nodes.get(al_uuid, (None, None))
-                    if fbx_aldata is None or fbx_aldata.id != b'AnimationLayer' or fbx_aldata.props[2] != b'':
+                for al_uuid, fbx_alitem, al_ctype in fbx_connection_graph.get_forward(acn_uuid, b'OO',
+                                                                                      b'AnimationLayer'):
+                    fbx_aldata, _blen_aldata = fbx_alitem
+                    if fbx_aldata.props[2] != b'':
                         continue
                     for as_uuid in get_astacks_from_alayer(al_uuid):
                         _fbx_alitem, anim_items = stacks[as_uuid][1][al_uuid]
@@ -2819,23 +3396,16 @@ def load(operator, context, filepath="",
                             anim_items.setdefault(item, {})[acn_uuid] = (cnode, item_prop)
 
             # AnimationCurves (real animation data).
-            for ac_uuid, fbx_acitem in fbx_table_nodes.items():
+            for ac_uuid, fbx_acitem in fbx_table_nodes_by_class.get((b'AnimationCurve', b''), ()):
                 fbx_acdata, _blen_data = fbx_acitem
-                if fbx_acdata.id != b'AnimationCurve' or fbx_acdata.props[2] != b'':
-                    continue
-                for acn_uuid, acn_ctype in fbx_connection_map.get(ac_uuid, ()):
-                    if acn_ctype.props[0] != b'OP':
-                        continue
-                    fbx_acndata, _bl_acndata = fbx_table_nodes.get(acn_uuid, (None, None))
-                    if (fbx_acndata is None or fbx_acndata.id != b'AnimationCurveNode' or
-                        fbx_acndata.props[2] != b'' or acn_uuid not in curvenodes):
-                        continue
-                    # Note this is an infamous simplification of the compound props stuff,
-                    # seems to be standard naming but we'll probably have to be smarter to handle more exotic files?
-                    channel = {b'd|X': 0, b'd|Y': 1, b'd|Z': 2, b'd|DeformPercent': 0}.get(acn_ctype.props[3], None)
-                    if channel is None:
-                        continue
-                    curvenodes[acn_uuid][ac_uuid] = (fbx_acitem, channel)
+                # Note this is an infamous simplification of the compound props stuff,
+                # seems to be standard naming but we'll probably have to be smarter to handle more exotic files?
+                for lnk_prop, channel in ((b'd|X', 0), (b'd|Y', 1), (b'd|Z', 2), (b'd|DeformPercent', 0)):
+                    for acn_uuid, (fbx_acndata, _bl_acndata), acn_ctype in fbx_connection_graph.get_forward(
+                            ac_uuid, b'OP', b'AnimationCurveNode', lnk_prop):
+                        if fbx_acndata.props[2] != b'' or acn_uuid not in curvenodes:
+                            continue
+                        curvenodes[acn_uuid][ac_uuid] = (fbx_acitem, channel)
 
             # And now that we have sorted all this, apply animations!
             blen_read_animations(fbx_tmpl_astack, fbx_tmpl_alayer, stacks, scene, settings.anim_offset)
@@ -2846,10 +3416,8 @@ def load(operator, context, filepath="",
 
     def _():
         # link Material's to Geometry (via Model's)
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Geometry', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Geometry':
-                continue
 
             mesh = fbx_table_nodes.get(fbx_uuid, (None, None))[1]
 
@@ -2935,10 +3503,8 @@ def load(operator, context, filepath="",
                 mtex.scale[:] = tex_map[2]
                 return mtex
 
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Material', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Material':
-                continue
 
             material = fbx_table_nodes.get(fbx_uuid, (None, None))[1]
             for (fbx_lnk,
@@ -3056,10 +3622,8 @@ def load(operator, context, filepath="",
         # if so, use the alpha channel.
 
         # Note: this could be made optional since images may have alpha but be entirely opaque
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
+        for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Material', ()):
             fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Material':
-                continue
             material = fbx_table_nodes.get(fbx_uuid, (None, None))[1]
             image, tex_map = material_images.get(material, {}).get(b'DiffuseColor', (None, None))
             # do we have alpha?
@@ -3093,10 +3657,8 @@ def load(operator, context, filepath="",
     def _():
         # Annoying workaround for cycles having no z-offset
         if material_decals and use_alpha_decals:
-            for fbx_uuid, fbx_item in fbx_table_nodes.items():
+            for fbx_uuid, fbx_item in fbx_table_nodes_by_id.get(b'Geometry', ()):
                 fbx_obj, blen_data = fbx_item
-                if fbx_obj.id != b'Geometry':
-                    continue
                 if fbx_obj.props[-1] == b'Mesh':
                     mesh = fbx_item[1]
 
@@ -3121,3 +3683,145 @@ def load(operator, context, filepath="",
 
     perfmon.level_down("Import finished.")
     return {'FINISHED'}
+
+
+# Prefix of the lines import worker processes print to report their progress to the main Blender process.
+_LOAD_WORKER_TAG = "FBX_IMPORT_WORKER: "
+
+
+def load_multi_worker(job_filepath):
+    """
+    Entry point of import worker processes (background Blender instances started by load_multi()),
+    parse and decode the files listed in given job file, and pickle results next to it (see load_decode()).
+    """
+    import json
+    import os
+    import pickle
+
+    with open(job_filepath, 'r', encoding='utf-8') as f:
+        job = json.load(f)
+
+    for file_idx, filepath in job["files"]:
+        try:
+            fbx_data = load_decode(filepath, job["use_custom_normals"], job["use_geom_decode"])
+            with open(os.path.join(job["outdir"], "%d.pickle" % file_idx), 'wb') as f:
+                pickle.dump(fbx_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            print(_LOAD_WORKER_TAG + json.dumps(("FAILED", file_idx, str(e))), flush=True)
+        else:
+            print(_LOAD_WORKER_TAG + json.dumps(("DONE", file_idx, "")), flush=True)
+
+
+def load_multi(operator, context, filepaths=(), import_jobs=1, **kwargs):
+    """
+    Import all given FBX files into current scene, one after the other (see load() for kwargs).
+
+    With import_jobs > 1, files are parsed and their meshes decoded ahead in that many background Blender processes,
+    while Blender data is created by current process, still in the order of filepaths.
+    A file failing to import is reported, and does not prevent importing the other ones.
+    """
+    import json
+    import os
+    import pickle
+    import subprocess
+    import tempfile
+    import threading
+
+    filepaths = list(filepaths)
+    import_jobs = min(import_jobs, len(filepaths))
+    failed = []
+
+    def load_file(filepath, fbx_data=None):
+        try:
+            ret = load(operator, context, filepath, fbx_data=fbx_data, **kwargs)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            ret = None
+            operator.report({'ERROR'}, "Import of %r failed: %s" % (filepath, e))
+        if ret != {'FINISHED'}:
+            failed.append(filepath)
+
+    if import_jobs <= 1:
+        for filepath in filepaths:
+            load_file(filepath)
+        if failed:
+            operator.report({'WARNING'}, "%d of %d files failed to import" % (len(failed), len(filepaths)))
+        return {'FINISHED'} if len(failed) < len(filepaths) else {'CANCELLED'}
+
+    # Decoded geometries do not bake space transform, no need to decode them in workers then.
+    use_geom_decode = not kwargs.get("bake_space_transform", False)
+    use_custom_normals = kwargs.get("use_custom_normals", True)
+    addon_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    with tempfile.TemporaryDirectory(prefix="fbx_import_") as outdir:
+        workers = []
+        for i in range(import_jobs):
+            files = [(file_idx, os.path.abspath(filepaths[file_idx]))
+                     for file_idx in range(i, len(filepaths), import_jobs)]
+            job_filepath = os.path.join(outdir, "job_%d.json" % i)
+            with open(job_filepath, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "files": files,
+                    "outdir": outdir,
+                    "use_custom_normals": use_custom_normals,
+                    "use_geom_decode": use_geom_decode,
+                }, f)
+            expr = ("import sys, importlib; sys.path.insert(0, %r); "
+                    "importlib.import_module(%r).load_multi_worker(%r)" % (addon_dir, __name__, job_filepath))
+            cmd = (bpy.app.binary_path, "--background", "--factory-startup", "--python-expr", expr)
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            workers.append((proc, files))
+
+        # Status of each file (None on success, error message otherwise), set as soon as its worker is done with it.
+        results = {}
+        results_ready = {file_idx: threading.Event() for file_idx in range(len(filepaths))}
+
+        def _read_worker_output(proc, files):
+            for line in proc.stdout:
+                line = line.decode('utf-8', 'replace').rstrip()
+                if not line.startswith(_LOAD_WORKER_TAG):
+                    continue
+                status, file_idx, msg = json.loads(line[len(_LOAD_WORKER_TAG):])
+                results[file_idx] = msg if status == "FAILED" else None
+                results_ready[file_idx].set()
+            ret_code = proc.wait()
+            for file_idx, _filepath in files:
+                if file_idx not in results:
+                    results[file_idx] = "worker process exited with code %d" % ret_code
+                    results_ready[file_idx].set()
+
+        threads = [threading.Thread(target=_read_worker_output, args=(proc, files)) for proc, files in workers]
+        for t in threads:
+            t.start()
+
+        # Blender data has to be created from main thread, in a deterministic order.
+        for file_idx, filepath in enumerate(filepaths):
+            results_ready[file_idx].wait()
+            print("Batch import %d/%d: %s" % (file_idx + 1, len(filepaths), filepath))
+            if results[file_idx] is not None:
+                operator.report({'ERROR'}, "Couldn't open file %r (%s)" % (filepath, results[file_idx]))
+                failed.append(filepath)
+                continue
+            result_filepath = os.path.join(outdir, "%d.pickle" % file_idx)
+            try:
+                with open(result_filepath, 'rb') as f:
+                    fbx_data = pickle.load(f)
+            except Exception as e:
+                operator.report({'ERROR'}, "Couldn't open file %r (%s)" % (filepath, e))
+                failed.append(filepath)
+                continue
+            finally:
+                if os.path.exists(result_filepath):
+                    os.remove(result_filepath)
+            load_file(filepath, fbx_data)
+            del fbx_data
+
+        for t in threads:
+            t.join()
+
+    if failed:
+        operator.report({'WARNING'}, "%d of %d files failed to import" % (len(failed), len(filepaths)))
+    return {'FINISHED'} if len(failed) < len(filepaths) else {'CANCELLED'}
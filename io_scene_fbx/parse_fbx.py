@@ -23,13 +23,24 @@
 
 __all__ = (
     "parse",
+    "parse_events",
     "data_types",
     "parse_version",
+    "parse_elem_at",
+    "index_build",
+    "index_write",
+    "index_read",
+    "index_get",
     "FBXElem",
+    "FBXLazyArray",
+    "FBXIndexEntry",
+    "FBXCompactTree",
+    "FBXCompactElem",
     )
 
-from struct import unpack
+from struct import pack, unpack, unpack_from, Struct, error as StructError
 import array
+import os
 import zlib
 
 from . import data_types
@@ -39,10 +50,17 @@ from . import data_types
 _BLOCK_SENTINEL_LENGTH = ...
 _BLOCK_SENTINEL_DATA = ...
 read_fbx_elem_uint = ...
+_ELEM_HEAD_STRUCT = ...
+_USE_LAZY_ARRAYS = False
+_PENDING_ARRAYS = None  # When inflating in threads, list of (props, index) of arrays left to inflate.
 _IS_BIG_ENDIAN = (__import__("sys").byteorder != 'little')
 _HEAD_MAGIC = b'Kaydara FBX Binary\x20\x20\x00\x1a\x00'
+_INDEX_MAGIC = b'FBX Offset Index\x00\x01'
+_INDEX_EXT = ".fbxidx"
 from collections import namedtuple
 FBXElem = namedtuple("FBXElem", ("id", "props", "props_type", "elems"))
+# One top-level object (direct child of 'Objects'), name is its raw b'Name\x00\x01Class' property.
+FBXIndexEntry = namedtuple("FBXIndexEntry", ("uuid", "id", "name", "offset", "length"))
 del namedtuple
 
 
@@ -64,13 +82,7 @@ def read_string_ubyte(read):
     return data
 
 
-def unpack_array(read, array_type, array_stride, array_byteswap):
-    length = read_uint(read)
-    encoding = read_uint(read)
-    comp_len = read_uint(read)
-
-    data = read(comp_len)
-
+def decode_array(data, encoding, length, array_type, array_stride, array_byteswap):
     if encoding == 0:
         pass
     elif encoding == 1:
@@ -78,12 +90,83 @@ def unpack_array(read, array_type, array_stride, array_byteswap):
 
     assert(length * array_stride == len(data))
 
-    data_array = array.array(array_type, data)
+    data_array = array.array(array_type)
+    data_array.frombytes(data)
     if array_byteswap and _IS_BIG_ENDIAN:
         data_array.byteswap()
     return data_array
 
 
+class FBXLazyArray:
+    """
+    Stand-in for a compressed array property, only inflated on first access to its items
+    (iteration, indexing...). Its length and typecode are known without inflating it.
+    It does not expose the buffer protocol, code needing a buffer (memoryview, NumPy...) has to use get()
+    (as e.g. import_fbx.elem_prop_array_as_np does).
+    """
+    __slots__ = (
+        "typecode",
+        "_length",
+        "_args",  # decode_array() arguments, until inflated.
+        "_array",
+        )
+
+    def __init__(self, data, encoding, length, array_type, array_stride, array_byteswap):
+        self.typecode = array_type
+        self._length = length
+        self._args = (data, encoding, length, array_type, array_stride, array_byteswap)
+        self._array = None
+
+    def get(self):
+        """Return the decoded array.array, inflating it if needed."""
+        data_array = self._array
+        if data_array is None:
+            data_array = self._array = decode_array(*self._args)
+            self._args = None  # Release compressed data.
+        return data_array
+
+    @property
+    def is_inflated(self):
+        return self._array is not None
+
+    @property
+    def itemsize(self):
+        return array.array(self.typecode).itemsize
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return iter(self.get())
+
+    def __getitem__(self, key):
+        return self.get()[key]
+
+    def __repr__(self):
+        return "FBXLazyArray(%r, length=%d%s)" % (self.typecode, self._length,
+                                                  "" if self.is_inflated else ", compressed")
+
+    def tobytes(self):
+        return self.get().tobytes()
+
+    def tolist(self):
+        return self.get().tolist()
+
+
+def unpack_array(read, array_type, array_stride, array_byteswap, use_lazy_arrays=None):
+    length = read_uint(read)
+    encoding = read_uint(read)
+    comp_len = read_uint(read)
+
+    data = read(comp_len)
+
+    if use_lazy_arrays is None:
+        use_lazy_arrays = _USE_LAZY_ARRAYS
+    if encoding == 1 and use_lazy_arrays:
+        return FBXLazyArray(data, encoding, length, array_type, array_stride, array_byteswap)
+    return decode_array(data, encoding, length, array_type, array_stride, array_byteswap)
+
+
 read_data_dict = {
     b'Y'[0]: lambda read: unpack(b'<h', read(2))[0],  # 16 bit int
     b'C'[0]: lambda read: unpack(b'?', read(1))[0],   # 1 bit bool (yes/no)
@@ -101,26 +184,135 @@ read_data_dict = {
     b'c'[0]: lambda read: unpack_array(read, data_types.ARRAY_BYTE, 1, False),  # array (ubyte)
     }
 
+# unpack_array() arguments of array property types.
+read_array_args = {
+    b'f'[0]: (data_types.ARRAY_FLOAT32, 4, False),
+    b'i'[0]: (data_types.ARRAY_INT32, 4, True),
+    b'd'[0]: (data_types.ARRAY_FLOAT64, 8, False),
+    b'l'[0]: (data_types.ARRAY_INT64, 8, True),
+    b'b'[0]: (data_types.ARRAY_BOOL, 1, False),
+    b'c'[0]: (data_types.ARRAY_BYTE, 1, False),
+    }
+
+
+def defer_arrays(elem_props_data, start=0):
+    for i in range(start, len(elem_props_data)):
+        if elem_props_data[i].__class__ is FBXLazyArray:
+            _PENDING_ARRAYS.append((elem_props_data, i))
+
+
+def inflate_arrays(pending):
+    """
+    Inflate all given lazy arrays using a pool of threads (zlib releases the GIL while working),
+    and put the decoded arrays in place of the lazy ones.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as executor:
+        for (elem_props_data, i), data_array in zip(pending, executor.map(lambda item: item[0][item[1]].get(),
+                                                                           pending)):
+            elem_props_data[i] = data_array
+
+
+# Buffer-based readers, used when parsing from a memory-mapped file.
+# They take the mmap object and an offset, and return the read value and the offset right after it.
+def read_bytes_from(buf, offset):
+    size = unpack_from(b'<I', buf, offset)[0]
+    offset += 4
+    return buf[offset:offset + size], offset + size
+
+
+def unpack_array_from(buf, offset, array_type, array_stride, array_byteswap):
+    length, encoding, comp_len = unpack_from(b'<3I', buf, offset)
+    offset += 12
+
+    data = memoryview(buf)[offset:offset + comp_len]
+    offset += comp_len
+
+    # Uncompressed arrays are returned as (zero-copy) views over the mapped file.
+    if encoding == 0 and not (array_byteswap and _IS_BIG_ENDIAN):
+        assert(length * array_stride == len(data))
+        return data.cast(array_type), offset
+
+    if encoding == 1 and _USE_LAZY_ARRAYS:
+        # Copy compressed data, so that lazy arrays do not keep the whole mapping alive.
+        return FBXLazyArray(bytes(data), encoding, length, array_type, array_stride, array_byteswap), offset
+    return decode_array(data, encoding, length, array_type, array_stride, array_byteswap), offset
+
+
+read_data_from_dict = {
+    b'Y'[0]: lambda buf, ofs: (unpack_from(b'<h', buf, ofs)[0], ofs + 2),  # 16 bit int
+    b'C'[0]: lambda buf, ofs: (unpack_from(b'?', buf, ofs)[0], ofs + 1),   # 1 bit bool (yes/no)
+    b'I'[0]: lambda buf, ofs: (unpack_from(b'<i', buf, ofs)[0], ofs + 4),  # 32 bit int
+    b'F'[0]: lambda buf, ofs: (unpack_from(b'<f', buf, ofs)[0], ofs + 4),  # 32 bit float
+    b'D'[0]: lambda buf, ofs: (unpack_from(b'<d', buf, ofs)[0], ofs + 8),  # 64 bit float
+    b'L'[0]: lambda buf, ofs: (unpack_from(b'<q', buf, ofs)[0], ofs + 8),  # 64 bit int
+    b'R'[0]: read_bytes_from,                                               # binary data
+    b'S'[0]: read_bytes_from,                                               # string data
+    b'f'[0]: lambda buf, ofs: unpack_array_from(buf, ofs, data_types.ARRAY_FLOAT32, 4, False),  # array (float)
+    b'i'[0]: lambda buf, ofs: unpack_array_from(buf, ofs, data_types.ARRAY_INT32, 4, True),   # array (int)
+    b'd'[0]: lambda buf, ofs: unpack_array_from(buf, ofs, data_types.ARRAY_FLOAT64, 8, False),  # array (double)
+    b'l'[0]: lambda buf, ofs: unpack_array_from(buf, ofs, data_types.ARRAY_INT64, 8, True),   # array (long)
+    b'b'[0]: lambda buf, ofs: unpack_array_from(buf, ofs, data_types.ARRAY_BOOL, 1, False),  # array (bool)
+    b'c'[0]: lambda buf, ofs: unpack_array_from(buf, ofs, data_types.ARRAY_BYTE, 1, False),  # array (ubyte)
+    }
+
 
 # FBX 7500 (aka FBX2016) introduces incompatible changes at binary level:
 #   * The NULL block marking end of nested stuff switches from 13 bytes long to 25 bytes long.
 #   * The FBX element metadata (end_offset, prop_count and prop_length) switch from uint32 to uint64.
-def init_version(fbx_version):
-    global _BLOCK_SENTINEL_LENGTH, _BLOCK_SENTINEL_DATA, read_fbx_elem_uint
+def version_readers(fbx_version):
+    """
+    Return the (block_sentinel_length, read_elem_uint, elem_head_struct) matching given FBX version.
+    """
+    if fbx_version < 7500:
+        return 13, read_uint, Struct(b'<3I')
+    return 25, read_uint64, Struct(b'<3Q')
 
-    _BLOCK_SENTINEL_LENGTH = ...
-    _BLOCK_SENTINEL_DATA = ...
-    read_fbx_elem_uint = ...
 
-    if fbx_version < 7500:
-        _BLOCK_SENTINEL_LENGTH = 13
-        read_fbx_elem_uint = read_uint
-    else:
-        _BLOCK_SENTINEL_LENGTH = 25
-        read_fbx_elem_uint = read_uint64
+def init_version(fbx_version):
+    global _BLOCK_SENTINEL_LENGTH, _BLOCK_SENTINEL_DATA, read_fbx_elem_uint, _ELEM_HEAD_STRUCT
+
+    _BLOCK_SENTINEL_LENGTH, read_fbx_elem_uint, _ELEM_HEAD_STRUCT = version_readers(fbx_version)
     _BLOCK_SENTINEL_DATA = (b'\0' * _BLOCK_SENTINEL_LENGTH)
 
 
+def read_elem_head(read, read_elem_uint=None):
+    """
+    Read only the header of an element, return (end_offset, prop_count, prop_length, elem_id),
+    or None for the NULL record.
+    read_elem_uint defaults to the reader of the version set by init_version().
+    """
+    if read_elem_uint is None:
+        read_elem_uint = read_fbx_elem_uint
+    end_offset = read_elem_uint(read)
+    if end_offset == 0:
+        return None
+
+    prop_count = read_elem_uint(read)
+    prop_length = read_elem_uint(read)
+    elem_id = read_string_ubyte(read)
+    return end_offset, prop_count, prop_length, elem_id
+
+
+def read_elem_props(read, prop_count, use_lazy_arrays=None):
+    """
+    Read properties of an element, use_lazy_arrays overrides the module setting (see parse()) when not None.
+    """
+    elem_props_type = bytearray(prop_count)  # elem property types
+    elem_props_data = [None] * prop_count    # elem properties (if any)
+
+    for i in range(prop_count):
+        data_type = read(1)[0]
+        if use_lazy_arrays is not None and data_type in read_array_args:
+            elem_props_data[i] = unpack_array(read, *read_array_args[data_type], use_lazy_arrays=use_lazy_arrays)
+        else:
+            elem_props_data[i] = read_data_dict[data_type](read)
+        elem_props_type[i] = data_type
+
+    return elem_props_data, elem_props_type
+
+
 def read_elem(read, tell, use_namedtuple):
     # [0] the offset at which this block ends
     # [1] the number of properties in the scope
@@ -141,6 +333,8 @@ def read_elem(read, tell, use_namedtuple):
         data_type = read(1)[0]
         elem_props_data[i] = read_data_dict[data_type](read)
         elem_props_type[i] = data_type
+    if _PENDING_ARRAYS is not None:
+        defer_arrays(elem_props_data)
 
     if tell() < end_offset:
         while tell() < (end_offset - _BLOCK_SENTINEL_LENGTH):
@@ -157,6 +351,213 @@ def read_elem(read, tell, use_namedtuple):
     return FBXElem(*args) if use_namedtuple else args
 
 
+def read_elem_from(buf, offset, use_namedtuple):
+    """
+    Same as read_elem, but walking a memory-mapped file from given offset.
+    Return the element (None for the NULL record) and the offset right after it.
+    """
+    # [0] the offset at which this block ends
+    # [1] the number of properties in the scope
+    # [2] the length of the property list
+    end_offset, prop_count, prop_length = _ELEM_HEAD_STRUCT.unpack_from(buf, offset)
+    offset += _ELEM_HEAD_STRUCT.size
+    if end_offset == 0:
+        return None, offset
+
+    id_len = buf[offset]
+    offset += 1
+    elem_id = buf[offset:offset + id_len]  # elem name of the scope/key
+    offset += id_len
+    elem_props_type = bytearray(prop_count)  # elem property types
+    elem_props_data = [None] * prop_count    # elem properties (if any)
+    elem_subtree = []                        # elem children (if any)
+
+    for i in range(prop_count):
+        data_type = buf[offset]
+        elem_props_data[i], offset = read_data_from_dict[data_type](buf, offset + 1)
+        elem_props_type[i] = data_type
+    if _PENDING_ARRAYS is not None:
+        defer_arrays(elem_props_data)
+
+    if offset < end_offset:
+        while offset < (end_offset - _BLOCK_SENTINEL_LENGTH):
+            elem, offset = read_elem_from(buf, offset, use_namedtuple)
+            elem_subtree.append(elem)
+
+        if buf[offset:offset + _BLOCK_SENTINEL_LENGTH] != _BLOCK_SENTINEL_DATA:
+            raise IOError("failed to read nested block sentinel, "
+                          "expected all bytes to be 0")
+        offset += _BLOCK_SENTINEL_LENGTH
+
+    if offset != end_offset:
+        raise IOError("scope length not reached, something is wrong")
+
+    args = (elem_id, elem_props_data, elem_props_type, elem_subtree)
+    return (FBXElem(*args) if use_namedtuple else args), offset
+
+
+class FBXCompactTree:
+    """
+    Compact storage of a whole parsed FBX tree, as a flat table of nodes (in depth-first order) made of parallel
+    arrays, instead of one FBXElem (with its own props, props_type and elems containers) per element.
+    Node 0 is the (id-less) root. Children of a node directly follow it, and each node stores the index right after
+    its whole subtree (i.e. its next sibling, if any). Its properties are a range of the flat props list.
+    Elements are accessed through FBXCompactElem views, exposing the same id/props/props_type/elems as FBXElem.
+    """
+    __slots__ = (
+        "ids",  # Interned element ids.
+        "_ids_map",  # Element id -> index in ids.
+
+        # Per node.
+        "id_index",  # Index of the element id in ids.
+        "parent",  # Index of the parent node (-1 for root).
+        "subtree_end",  # Index of the first node after the subtree.
+        "props_start",  # Index of the first property in props (one extra item at the end, once finalized).
+
+        "props",  # All properties, flat.
+        "props_type",  # All properties types, flat.
+
+        "_elems",  # Node index -> list of its children views, built on first access (see FBXCompactElem.elems).
+        )
+
+    def __init__(self):
+        self.ids = [b'']
+        self._ids_map = {b'': 0}
+        self.id_index = array.array(data_types.ARRAY_INT32, (0,))
+        self.parent = array.array(data_types.ARRAY_INT32, (-1,))
+        self.subtree_end = array.array(data_types.ARRAY_INT32, (0,))
+        self.props_start = array.array(data_types.ARRAY_INT32, (0,))
+        self.props = []
+        self.props_type = bytearray()
+        self._elems = {}
+
+    def __len__(self):
+        return len(self.id_index)
+
+    def add_node(self, elem_id, parent):
+        id_index = self._ids_map.get(elem_id)
+        if id_index is None:
+            id_index = self._ids_map[elem_id] = len(self.ids)
+            self.ids.append(elem_id)
+        index = len(self.id_index)
+        self.id_index.append(id_index)
+        self.parent.append(parent)
+        self.subtree_end.append(0)  # Set once the whole subtree has been read.
+        self.props_start.append(len(self.props))
+        return index
+
+    def finalize(self):
+        self.subtree_end[0] = len(self.id_index)
+        self.props_start.append(len(self.props))
+
+    @property
+    def root(self):
+        return FBXCompactElem(self, 0)
+
+
+class FBXCompactElem:
+    """
+    View over one node of an FBXCompactTree, with FBXElem-like (read-only) accessors.
+    """
+    __slots__ = (
+        "tree",
+        "index",
+        )
+
+    def __init__(self, tree, index):
+        self.tree = tree
+        self.index = index
+
+    @property
+    def id(self):
+        tree = self.tree
+        return tree.ids[tree.id_index[self.index]]
+
+    @property
+    def props(self):
+        # Note: a new list (slice of the flat props one) on each access.
+        tree = self.tree
+        index = self.index
+        return tree.props[tree.props_start[index]:tree.props_start[index + 1]]
+
+    @property
+    def props_type(self):
+        tree = self.tree
+        index = self.index
+        return tree.props_type[tree.props_start[index]:tree.props_start[index + 1]]
+
+    @property
+    def elems(self):
+        # Children views are cached, so that repeated lookups neither allocate nor change identity of views.
+        # The returned list is shared, it must not be modified.
+        tree = self.tree
+        elems = tree._elems.get(self.index)
+        if elems is None:
+            subtree_end = tree.subtree_end
+            end = subtree_end[self.index]
+            child = self.index + 1
+            elems = []
+            while child < end:
+                elems.append(FBXCompactElem(tree, child))
+                child = subtree_end[child]
+            tree._elems[self.index] = elems
+        return elems
+
+    @property
+    def parent(self):
+        parent = self.tree.parent[self.index]
+        return None if parent < 0 else FBXCompactElem(self.tree, parent)
+
+    def __eq__(self, other):
+        return (other.__class__ is FBXCompactElem) and (self.tree is other.tree) and (self.index == other.index)
+
+    def __hash__(self):
+        return hash((id(self.tree), self.index))
+
+    def __repr__(self):
+        return "FBXCompactElem(%r, index=%d)" % (self.id, self.index)
+
+
+def read_elem_compact(read, tell, tree, parent):
+    """
+    Same as read_elem, but adding the element (and its whole subtree) to given FBXCompactTree.
+    Return False for the NULL record.
+    """
+    end_offset = read_fbx_elem_uint(read)
+    if end_offset == 0:
+        return False
+
+    prop_count = read_fbx_elem_uint(read)
+    prop_length = read_fbx_elem_uint(read)
+
+    elem_id = read_string_ubyte(read)
+    index = tree.add_node(elem_id, parent)
+
+    props_data = tree.props
+    props_type = tree.props_type
+    props_start = len(props_data)
+    for i in range(prop_count):
+        data_type = read(1)[0]
+        props_data.append(read_data_dict[data_type](read))
+        props_type.append(data_type)
+    if _PENDING_ARRAYS is not None:
+        defer_arrays(props_data, props_start)
+
+    if tell() < end_offset:
+        while tell() < (end_offset - _BLOCK_SENTINEL_LENGTH):
+            read_elem_compact(read, tell, tree, index)
+
+        if read(_BLOCK_SENTINEL_LENGTH) != _BLOCK_SENTINEL_DATA:
+            raise IOError("failed to read nested block sentinel, "
+                          "expected all bytes to be 0")
+
+    if tell() != end_offset:
+        raise IOError("scope length not reached, something is wrong")
+
+    tree.subtree_end[index] = len(tree.id_index)
+    return True
+
+
 def parse_version(fn):
     """
     Return the FBX version,
@@ -171,9 +572,133 @@ def parse_version(fn):
         return read_uint(read)
 
 
-def parse(fn, use_namedtuple=True):
+def parse_mmap(f, root_elems, use_namedtuple, include):
+    """
+    Parse the whole file through a read-only memory map, instead of many small file reads.
+    Uncompressed arrays are returned as memoryviews over the mapping (which stays alive as long as they do),
+    the mapping is closed right away when none was returned.
+    """
+    import mmap
+
+    # Mapping an empty file fails, report it the same way as other invalid files.
+    if os.fstat(f.fileno()).st_size < len(_HEAD_MAGIC):
+        raise IOError("Invalid header")
+
+    buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        offset = len(_HEAD_MAGIC)
+        if buf[:offset] != _HEAD_MAGIC:
+            raise IOError("Invalid header")
+
+        fbx_version = unpack_from(b'<I', buf, offset)[0]
+        offset += 4
+        init_version(fbx_version)
+
+        while True:
+            if include is not None:
+                end_offset = _ELEM_HEAD_STRUCT.unpack_from(buf, offset)[0]
+                if end_offset != 0:
+                    id_offset = offset + _ELEM_HEAD_STRUCT.size
+                    if not include(buf[id_offset + 1:id_offset + 1 + buf[id_offset]]):
+                        offset = end_offset
+                        continue
+            elem, offset = read_elem_from(buf, offset, use_namedtuple)
+            if elem is None:
+                break
+            root_elems.append(elem)
+    finally:
+        try:
+            buf.close()
+        except BufferError:
+            pass  # Still used by returned arrays.
+
+    return fbx_version
+
+
+def parse(fn, use_namedtuple=True, use_mmap=False, use_lazy_arrays=False, use_threads=False, include=None,
+          use_compact=False):
+    """
+    Parse given binary FBX file, return its root element and its version.
+    When use_compact is set, the whole tree is stored in an FBXCompactTree, and the root FBXCompactElem is returned
+    (not supported with use_mmap).
+    When use_mmap is set, the file is memory-mapped and walked with offsets (see parse_mmap).
+    Uncompressed arrays are then returned as memoryviews over the mapping instead of array.array
+    (they have a format, but no typecode), and the file stays mapped as long as any of them is alive
+    (which e.g. prevents replacing it on Windows).
+    When use_lazy_arrays is set, compressed arrays are returned as FBXLazyArray, only inflated when accessed.
+    When use_threads is set, compressed arrays are collected while walking the file,
+    and all inflated afterwards by a pool of threads.
+    include may be a collection of top-level element ids (e.g. {b'GlobalSettings', b'Connections'}),
+    or a predicate taking such an id, other top-level elements are skipped without being read.
+    """
+    global _USE_LAZY_ARRAYS, _PENDING_ARRAYS
+    if use_compact and use_mmap:
+        raise ValueError("Compact tree parsing is not supported from memory-mapped files")
+
+    if include is not None and not callable(include):
+        include = frozenset(include).__contains__
+
     root_elems = []
+    tree = FBXCompactTree() if use_compact else None
+
+    _USE_LAZY_ARRAYS = use_lazy_arrays or use_threads
+    _PENDING_ARRAYS = [] if use_threads else None
+    try:
+        with open(fn, 'rb') as f:
+            if use_mmap:
+                fbx_version = parse_mmap(f, root_elems, use_namedtuple, include)
+            else:
+                read = f.read
+                tell = f.tell
+                seek = f.seek
+
+                if read(len(_HEAD_MAGIC)) != _HEAD_MAGIC:
+                    raise IOError("Invalid header")
+
+                fbx_version = read_uint(read)
+                init_version(fbx_version)
+
+                while True:
+                    if include is not None:
+                        elem_offset = tell()
+                        elem_head = read_elem_head(read)
+                        if elem_head is not None:
+                            if not include(elem_head[3]):
+                                seek(elem_head[0])
+                                continue
+                            seek(elem_offset)
+                    if tree is not None:
+                        if not read_elem_compact(read, tell, tree, 0):
+                            break
+                        continue
+                    elem = read_elem(read, tell, use_namedtuple)
+                    if elem is None:
+                        break
+                    root_elems.append(elem)
+
+        if use_threads:
+            inflate_arrays(_PENDING_ARRAYS)
+    finally:
+        # Do not leak parsing state into later, unrelated parsing (e.g. parse_elem_at()).
+        _USE_LAZY_ARRAYS = False
+        _PENDING_ARRAYS = None
+
+    if tree is not None:
+        tree.finalize()
+        return tree.root, fbx_version
 
+    args = (b'', [], bytearray(0), root_elems)
+    return FBXElem(*args) if use_namedtuple else args, fbx_version
+
+
+def parse_events(fn, use_lazy_arrays=False):
+    """
+    Walk given binary FBX file without building any element tree, yielding (event, elem_id, props, props_type):
+        * ('start', elem_id, props, props_type) when entering an element;
+        * ('end', elem_id, None, None) when leaving it.
+    Only the stack of currently opened elements is kept in memory, closing the generator stops reading the file.
+    It does not use the module's parsing state, so several walks (and other parsing) may be interleaved.
+    """
     with open(fn, 'rb') as f:
         read = f.read
         tell = f.tell
@@ -182,13 +707,191 @@ def parse(fn, use_namedtuple=True):
             raise IOError("Invalid header")
 
         fbx_version = read_uint(read)
-        init_version(fbx_version)
+        # Kept local, other parsing may change the module's version-specific readers between events.
+        sentinel_length, read_elem_uint, _elem_head_struct = version_readers(fbx_version)
+        sentinel_data = b'\0' * sentinel_length
 
+        stack = []  # (end_offset, elem_id) of currently opened elements.
         while True:
-            elem = read_elem(read, tell, use_namedtuple)
-            if elem is None:
+            if stack:
+                end_offset, elem_id = stack[-1]
+                if tell() >= (end_offset - sentinel_length):
+                    if read(sentinel_length) != sentinel_data:
+                        raise IOError("failed to read nested block sentinel, "
+                                      "expected all bytes to be 0")
+                    if tell() != end_offset:
+                        raise IOError("scope length not reached, something is wrong")
+                    del stack[-1]
+                    yield ('end', elem_id, None, None)
+                    continue
+
+            elem_head = read_elem_head(read, read_elem_uint)
+            if elem_head is None:
+                if stack:
+                    raise IOError("unexpected NULL record, something is wrong")
                 break
-            root_elems.append(elem)
+            end_offset, prop_count, _prop_length, elem_id = elem_head
 
-    args = (b'', [], bytearray(0), root_elems)
-    return FBXElem(*args) if use_namedtuple else args, fbx_version
+            elem_props_data, elem_props_type = read_elem_props(read, prop_count, use_lazy_arrays)
+            yield ('start', elem_id, elem_props_data, elem_props_type)
+
+            if tell() < end_offset:
+                stack.append((end_offset, elem_id))
+            else:
+                if tell() != end_offset:
+                    raise IOError("scope length not reached, something is wrong")
+                yield ('end', elem_id, None, None)
+
+
+# ----------------------------------------------------------------------------
+# Offset index of objects, for random access into (big) FBX files.
+
+def open_fbx(f):
+    """Check header of given opened file, and init parsing for its version. Return the FBX version."""
+    if f.read(len(_HEAD_MAGIC)) != _HEAD_MAGIC:
+        raise IOError("Invalid header")
+
+    fbx_version = read_uint(f.read)
+    init_version(fbx_version)
+    return fbx_version
+
+
+def parse_elem_at(fn, offset, use_namedtuple=True):
+    """
+    Parse only the element starting at given offset in given file (e.g. from an FBXIndexEntry).
+    """
+    global _USE_LAZY_ARRAYS, _PENDING_ARRAYS
+    _USE_LAZY_ARRAYS = False
+    _PENDING_ARRAYS = None
+
+    with open(fn, 'rb') as f:
+        open_fbx(f)
+        f.seek(offset)
+        elem = read_elem(f.read, f.tell, use_namedtuple)
+
+    if elem is None:
+        raise IOError("No element found at offset %d" % offset)
+    return elem
+
+
+def index_build(fn):
+    """
+    Scan given file for all children of its 'Objects' element, without reading their subtrees.
+    Return the FBX version and a list of FBXIndexEntry.
+    """
+    global _USE_LAZY_ARRAYS, _PENDING_ARRAYS
+    _USE_LAZY_ARRAYS = False
+    _PENDING_ARRAYS = None
+
+    entries = []
+
+    with open(fn, 'rb') as f:
+        read = f.read
+        tell = f.tell
+        seek = f.seek
+
+        fbx_version = open_fbx(f)
+
+        while True:
+            elem_head = read_elem_head(read)
+            if elem_head is None:
+                break
+            end_offset, _prop_count, prop_length, elem_id = elem_head
+            if elem_id != b'Objects':
+                seek(end_offset)
+                continue
+
+            seek(prop_length, 1)
+            while tell() < (end_offset - _BLOCK_SENTINEL_LENGTH):
+                obj_offset = tell()
+                obj_end_offset, obj_prop_count, _prop_length, obj_id = read_elem_head(read)
+                obj_props, obj_props_type = read_elem_props(read, obj_prop_count)
+                if obj_props_type[:2] == b'LS':
+                    entries.append(FBXIndexEntry(obj_props[0], obj_id, obj_props[1],
+                                                 obj_offset, obj_end_offset - obj_offset))
+                seek(obj_end_offset)
+            break
+
+    return fbx_version, entries
+
+
+def index_path(fn):
+    # Suffix the whole file name, so that e.g. 'a.fbx' and 'a.FBX' do not share the same index.
+    return fn + _INDEX_EXT
+
+
+def index_write(fn, fbx_version, entries):
+    """
+    Write given index entries into the sidecar file of given FBX file (same path, with an extra '.fbxidx' extension).
+    Size and modification time of the FBX file are stored too, to detect outdated indices.
+    """
+    st = os.stat(fn)
+    # Write into a temp file first, so that concurrent readers never see a partially written index.
+    fn_index = index_path(fn)
+    fn_index_tmp = fn_index + ".tmp"
+    try:
+        with open(fn_index_tmp, 'wb') as f:
+            write = f.write
+            write(_INDEX_MAGIC)
+            write(pack(b'<IQqI', fbx_version, st.st_size, st.st_mtime_ns, len(entries)))
+            for e in entries:
+                write(pack(b'<qQQB', e.uuid, e.offset, e.length, len(e.id)))
+                write(e.id)
+                write(pack(b'<I', len(e.name)))
+                write(e.name)
+        os.replace(fn_index_tmp, fn_index)
+    except BaseException:
+        if os.path.exists(fn_index_tmp):
+            os.remove(fn_index_tmp)
+        raise
+
+
+def index_read(fn):
+    """
+    Read the sidecar index of given FBX file, return its FBX version and list of FBXIndexEntry,
+    or None if there is no index, or if it does not match the current FBX file, or if it is truncated.
+    """
+    try:
+        f = open(index_path(fn), 'rb')
+    except OSError:
+        return None
+
+    with f:
+        read = f.read
+        if read(len(_INDEX_MAGIC)) != _INDEX_MAGIC:
+            return None
+
+        try:
+            fbx_version, size, mtime_ns, count = unpack(b'<IQqI', read(24))
+            st = os.stat(fn)
+            if (size, mtime_ns) != (st.st_size, st.st_mtime_ns):
+                return None
+
+            entries = [None] * count
+            for i in range(count):
+                uuid, offset, length, id_len = unpack(b'<qQQB', read(25))
+                elem_id = read(id_len)
+                name_len = read_uint(read)
+                name = read(name_len)
+                if len(elem_id) != id_len or len(name) != name_len:
+                    return None
+                entries[i] = FBXIndexEntry(uuid, elem_id, name, offset, length)
+        except StructError:
+            return None
+
+    return fbx_version, entries
+
+
+def index_get(fn):
+    """
+    Return the (FBX version, list of FBXIndexEntry) index of given FBX file,
+    reading it from its sidecar file when up-to-date, building and writing it otherwise.
+    """
+    index = index_read(fn)
+    if index is None:
+        index = index_build(fn)
+        try:
+            index_write(fn, *index)
+        except OSError as e:
+            print("WARNING: could not write FBX index file %r (%s)" % (index_path(fn), e))
+    return index